@@ -0,0 +1,41 @@
+"""Optional Numba JIT support.
+
+Numba is an optional dependency (``pip install rm-gregg[fast]``). When it is
+not installed, ``njit`` degrades to a no-op decorator and ``prange`` to
+``range`` so the same kernels run as plain Python.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+_numba_njit: Any
+prange: Any
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+
+    HAS_NUMBA = True
+except ImportError:
+    _numba_njit = None
+    prange = range
+    HAS_NUMBA = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile a function with ``numba.njit`` if available, else return it unchanged.
+
+    Supports both the bare ``@njit`` and the ``@njit(cache=True)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        return fn
+
+    return decorator
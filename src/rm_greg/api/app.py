@@ -9,6 +9,11 @@ Provides endpoints for:
 
 from __future__ import annotations
 
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -21,19 +26,66 @@ except ImportError as e:
         "FastAPI is required for the API server. Install with: pip install rm-gregg[api]"
     ) from e
 
+from rm_greg.api.batching import MicroBatcher
 from rm_greg.models import NormalizedStroke, NormalizedPoint
 
+# Path to a trained StrokeClassifier; classification is disabled when unset
+MODEL_PATH_ENV = "RM_GREGG_MODEL"
+
+# Bytes read per chunk when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Upper bound on threads running CPU-bound batches
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Classified once at startup so the compiled feature kernel is loaded before
+# the first request instead of during it
+_WARMUP_STROKE = NormalizedStroke(
+    points=[NormalizedPoint(x=0.0, y=0.0), NormalizedPoint(x=0.1, y=0.1)]
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the worker pool and batchers, and load the classifier if configured."""
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    app.state.classify_batcher = None
+
+    model_path = os.environ.get(MODEL_PATH_ENV)
+    if model_path:
+        from rm_greg.training.stroke_classifier import StrokeClassifier
+
+        classifier = StrokeClassifier.load(Path(model_path))
+        await asyncio.get_running_loop().run_in_executor(
+            executor, classifier.predict_proba_batch, [_WARMUP_STROKE]
+        )
+        app.state.classify_batcher = MicroBatcher(
+            classifier.predict_proba_batch,
+            executor,
+        )
+        app.state.classify_batcher.start()
+
+    try:
+        yield
+    finally:
+        if app.state.classify_batcher is not None:
+            await app.state.classify_batcher.stop()
+            app.state.classify_batcher = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="rm-gregg",
     description="Gregg Shorthand Practice Feedback API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
 class StrokeInput(BaseModel):
     """A stroke submitted for classification or feedback."""
 
-    points: list[dict[str, float]] = Field(
+    points: list[NormalizedPoint] = Field(
         description="List of points with x, y, pressure, etc."
     )
     label: str | None = Field(default=None, description="Expected label if known")
@@ -67,10 +119,25 @@ async def classify_stroke(stroke_input: StrokeInput) -> ClassificationResult:
     """Classify a single stroke as a Gregg shorthand primitive.
 
     Accepts a stroke as a list of points and returns the predicted
-    Gregg primitive label with confidence scores.
+    Gregg primitive label with confidence scores. Concurrent requests are
+    batched and run off the event loop.
     """
-    # TODO: Load model and classify
-    raise HTTPException(status_code=501, detail="Classification not yet implemented")
+    batcher = getattr(app.state, "classify_batcher", None)
+    if batcher is None:
+        raise HTTPException(status_code=501, detail="Classification not yet implemented")
+
+    if len(stroke_input.points) < 2:
+        raise HTTPException(status_code=400, detail="Stroke must have at least 2 points")
+
+    stroke = NormalizedStroke(points=stroke_input.points)
+    probabilities = await batcher.submit(stroke)
+    predicted_label = max(probabilities, key=probabilities.__getitem__)
+
+    return ClassificationResult(
+        predicted_label=predicted_label,
+        confidence=probabilities[predicted_label],
+        probabilities=probabilities,
+    )
 
 
 @app.post("/api/v1/feedback", response_model=FeedbackResult)
@@ -100,10 +167,10 @@ async def upload_rm_file(file: UploadFile) -> dict[str, str]:
     if not file.filename or not file.filename.endswith(".rm"):
         raise HTTPException(status_code=400, detail="Only .rm files are accepted")
 
-    # Save to temp file and process
+    # Stream to temp file in chunks so memory stays bounded for large uploads
     with NamedTemporaryFile(suffix=".rm", delete=False) as tmp:
-        content = await file.read()
-        tmp.write(content)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            tmp.write(chunk)
         tmp_path = Path(tmp.name)
 
     # TODO: Process the uploaded file
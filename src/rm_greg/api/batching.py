@@ -0,0 +1,104 @@
+"""Micro-batching of CPU-bound work for the API server.
+
+Classification and stroke comparison are CPU-bound, so running them inside
+``async def`` endpoints would block the event loop. A MicroBatcher collects
+items submitted by concurrent requests for a few milliseconds, runs them as a
+single batch on a bounded executor, and hands each request its own result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Coalesce concurrent submissions into batched calls on an executor.
+
+    Args:
+        batch_fn: Function mapping a list of items to a list of results of the
+            same length and order. Runs on ``executor``, not the event loop.
+        executor: Bounded pool the batches run on.
+        max_batch: Maximum number of items per batch.
+        max_latency: Seconds to wait for more items after the first one arrives.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], list[R]],
+        executor: Executor,
+        max_batch: int = 32,
+        max_latency: float = 0.01,
+    ) -> None:
+        self.batch_fn = batch_fn
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future[R]]] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background consumer on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._consume())
+
+    async def stop(self) -> None:
+        """Stop the background consumer. Queued and in-flight submissions are cancelled."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result."""
+        if self._task is None:
+            raise RuntimeError("MicroBatcher has not been started")
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[T, asyncio.Future[R]]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_latency
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                items = [item for item, _ in batch]
+                try:
+                    results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), result in zip(batch, results, strict=False):
+                    if not future.done():
+                        future.set_result(result)
+        except BaseException:
+            # Already dequeued, so stop() cannot see them; cancel the in-flight batch here
+            for _, future in batch:
+                future.cancel()
+            raise
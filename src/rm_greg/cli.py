@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 
 
@@ -60,6 +61,12 @@ def main(argv: list[str] | None = None) -> int:
     serve_parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     serve_parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
     serve_parser.add_argument("--model", help="Path to trained model")
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Number of worker processes",
+    )
 
     args = parser.parse_args(argv)
 
@@ -67,10 +74,37 @@ def main(argv: list[str] | None = None) -> int:
         parser.print_help()
         return 0
 
-    # Dispatch to subcommands (to be implemented)
+    if args.command == "serve":
+        return _serve(args)
+
+    # Dispatch to remaining subcommands (to be implemented)
     print(f"Command '{args.command}' is not yet implemented.")
     return 1
 
 
+def _serve(args: argparse.Namespace) -> int:
+    """Run the API server with uvicorn."""
+    try:
+        import uvicorn
+    except ImportError:
+        print("uvicorn is required for the API server. Install with: pip install rm-gregg[api]")
+        return 1
+
+    if args.model:
+        # Read by the app's lifespan in every worker process
+        os.environ["RM_GREGG_MODEL"] = args.model
+
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+    uvicorn.run(
+        "rm_greg.api.app:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="auto",
+        http="auto",
+    )
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -6,19 +6,29 @@ identifies specific deviations.
 
 from __future__ import annotations
 
+import math
+import threading
+import weakref
 from dataclasses import dataclass
 
 import numpy as np
 
+from rm_greg._jit import njit, prange
 from rm_greg.models import NormalizedStroke
-from rm_greg.preprocessing.normalize import stroke_to_array
+
+# Number of evenly spaced points strokes are resampled to before DTW/Fréchet
+RESAMPLE_POINTS = 64
+
+# Default Sakoe-Chiba band half-width for DTW between resampled paths. Both
+# paths are spaced evenly by arc length, so good matches stay near the diagonal.
+DTW_WINDOW = max(5, RESAMPLE_POINTS // 10)
 
 
 @dataclass
 class StrokeComparison:
     """Results of comparing a user stroke to a reference."""
 
-    dtw_distance: float
+    dtw_distance: float  # Per-point DTW deviation, independent of sampling density
     frechet_distance: float
     size_ratio: float  # user_size / reference_size
     curvature_deviation: float  # Difference in total curvature
@@ -41,147 +51,550 @@ class StrokeComparison:
         return 0.4 * dtw_score + 0.2 * size_score + 0.2 * curve_score + 0.2 * angle_score
 
 
+@dataclass(frozen=True)
+class StrokeProfile:
+    """Per-stroke quantities that only depend on one side of a comparison.
+
+    Reference strokes are compared against many user attempts, so their
+    profiles are computed once and cached by ``compare_strokes``.
+    """
+
+    xy: np.ndarray  # (N, 2) C-contiguous float32 coordinates
+    path: np.ndarray  # (RESAMPLE_POINTS, 2) arc-length resampling of xy for DTW/Fréchet
+    size: float  # Bounding-box diagonal
+    aspect_ratio: float  # height / width, 0.0 for vertical strokes
+    total_curvature: float  # Sum of absolute turning angles
+    start_angle: float
+    end_angle: float
+
+
+def profile_stroke(stroke: NormalizedStroke) -> StrokeProfile:
+    """Compute the comparison profile of a single stroke.
+
+    Args:
+        stroke: A normalized stroke with at least one point.
+
+    Returns:
+        StrokeProfile with the stroke's coordinates and shape quantities.
+    """
+    return profile_points(stroke.array)
+
+
+def profile_points(xy: np.ndarray) -> StrokeProfile:
+    """Compute the comparison profile of a stroke given as a coordinate array.
+
+    This skips the per-point Pydantic models entirely, for callers that already
+    hold stroke data as arrays.
+
+    Args:
+        xy: Array of shape (N, 2) with normalized x, y coordinates.
+
+    Returns:
+        StrokeProfile with the stroke's coordinates and shape quantities.
+    """
+    xy = np.ascontiguousarray(xy[:, :2], dtype=np.float32)
+    return _build_profile(xy, _total_curvature(xy))
+
+
+def _profile_many(strokes: list[NormalizedStroke]) -> list[StrokeProfile]:
+    """Profile several strokes, computing all their curvatures in one pass."""
+    xys = [np.ascontiguousarray(s.array[:, :2], dtype=np.float32) for s in strokes]
+    curvatures = batch_total_curvature(xys)
+    return [_build_profile(xy, float(c)) for xy, c in zip(xys, curvatures, strict=True)]
+
+
+def _build_profile(xy: np.ndarray, total_curvature: float) -> StrokeProfile:
+    """Assemble a profile from contiguous float32 coordinates and their curvature."""
+    size, aspect_ratio = _bbox_stats(xy)
+    start_angle, end_angle = _end_angles(xy)
+
+    return StrokeProfile(
+        xy=xy,
+        path=_resample_arclength(xy, RESAMPLE_POINTS),
+        size=size,
+        aspect_ratio=aspect_ratio,
+        total_curvature=total_curvature,
+        start_angle=start_angle,
+        end_angle=end_angle,
+    )
+
+
+# id(stroke) -> (weak reference to the stroke, its profile)
+_PROFILE_CACHE: dict[int, tuple[weakref.ref[NormalizedStroke], StrokeProfile]] = {}
+
+
+def _cached_profile(stroke: NormalizedStroke) -> StrokeProfile:
+    """Return the profile for a stroke, reusing it while the stroke object is alive."""
+    key = id(stroke)
+    entry = _PROFILE_CACHE.get(key)
+    if entry is not None and entry[0]() is stroke:
+        return entry[1]
+
+    profile = profile_stroke(stroke)
+    _PROFILE_CACHE[key] = (
+        weakref.ref(stroke, lambda _: _PROFILE_CACHE.pop(key, None)),
+        profile,
+    )
+    return profile
+
+
 def compare_strokes(
-    user_stroke: NormalizedStroke,
-    reference_stroke: NormalizedStroke,
+    user_stroke: NormalizedStroke | StrokeProfile,
+    reference_stroke: NormalizedStroke | StrokeProfile,
+    window: int | None = DTW_WINDOW,
 ) -> StrokeComparison:
     """Compare a user's stroke attempt to a reference stroke.
 
+    Either side may be passed as a precomputed StrokeProfile. Reference strokes
+    passed as models are profiled once and cached per object, so they must not
+    be mutated once they have been compared against. Strokes with identical
+    coordinates are recognized up front and skip the distance computations.
+
     Args:
         user_stroke: The user's stroke attempt.
         reference_stroke: The canonical reference stroke.
+        window: Sakoe-Chiba band half-width for DTW, in resampled points.
+            ``None`` computes the unconstrained DTW distance.
 
     Returns:
         StrokeComparison with detailed deviation metrics.
     """
-    user_arr = stroke_to_array(user_stroke)[:, :2]  # x, y only
-    ref_arr = stroke_to_array(reference_stroke)[:, :2]
+    if user_stroke is reference_stroke:
+        return _identical_comparison()
+
+    user = user_stroke if isinstance(user_stroke, StrokeProfile) else profile_stroke(user_stroke)
+    ref = (
+        reference_stroke
+        if isinstance(reference_stroke, StrokeProfile)
+        else _cached_profile(reference_stroke)
+    )
+    if np.array_equal(user.xy, ref.xy):
+        return _identical_comparison()
+
+    dtw_distance, frechet_distance = _compute_dtw_frechet(user.path, ref.path, window)
+    return StrokeComparison(
+        dtw_distance=dtw_distance,
+        frechet_distance=frechet_distance,
+        size_ratio=_compute_size_ratio(user, ref),
+        curvature_deviation=_compute_curvature_deviation(user, ref),
+        angle_deviation=_compute_angle_deviation(user, ref),
+        proportion_error=_compute_proportion_error(user, ref),
+    )
 
-    dtw_dist = _compute_dtw(user_arr, ref_arr)
-    frechet_dist = _compute_frechet(user_arr, ref_arr)
-    size_ratio = _compute_size_ratio(user_arr, ref_arr)
-    curvature_dev = _compute_curvature_deviation(user_arr, ref_arr)
-    angle_dev = _compute_angle_deviation(user_arr, ref_arr)
-    proportion_err = _compute_proportion_error(user_arr, ref_arr)
 
+def _identical_comparison() -> StrokeComparison:
+    """The comparison of a stroke with an exact copy of itself."""
     return StrokeComparison(
-        dtw_distance=dtw_dist,
-        frechet_distance=frechet_dist,
-        size_ratio=size_ratio,
-        curvature_deviation=curvature_dev,
-        angle_deviation=angle_dev,
-        proportion_error=proportion_err,
+        dtw_distance=0.0,
+        frechet_distance=0.0,
+        size_ratio=1.0,
+        curvature_deviation=0.0,
+        angle_deviation=0.0,
+        proportion_error=0.0,
     )
 
 
-def _compute_dtw(seq1: np.ndarray, seq2: np.ndarray) -> float:
+def compare_strokes_batch(
+    user_strokes: list[NormalizedStroke | StrokeProfile],
+    reference_stroke: NormalizedStroke | StrokeProfile,
+    window: int | None = DTW_WINDOW,
+) -> list[StrokeComparison]:
+    """Compare many user attempts against the same reference stroke.
+
+    Equivalent to calling ``compare_strokes`` for each attempt, but the
+    reference is profiled once, the attempts' curvatures are computed by
+    ``batch_total_curvature`` in one pass and, without dtaidistance, all DTW
+    distances are computed by a single parallel kernel over the stacked
+    resampled paths.
+
+    Args:
+        user_strokes: The user's stroke attempts.
+        reference_stroke: The canonical reference stroke.
+        window: Sakoe-Chiba band half-width for DTW, as in ``compare_strokes``.
+
+    Returns:
+        One StrokeComparison per attempt, in input order.
+    """
+    if not user_strokes:
+        return []
+
+    # Attempts given as models are profiled together so their curvatures share
+    # one arctan2 pass; precomputed profiles are used as-is
+    models = [s for s in user_strokes if not isinstance(s, StrokeProfile)]
+    profiled = iter(_profile_many(models))
+    users = [s if isinstance(s, StrokeProfile) else next(profiled) for s in user_strokes]
+    ref = (
+        reference_stroke
+        if isinstance(reference_stroke, StrokeProfile)
+        else _cached_profile(reference_stroke)
+    )
+    dtw_dists = _compute_dtw_batch(np.stack([u.path for u in users]), ref.path, window)
+
+    return [
+        StrokeComparison(
+            dtw_distance=float(dtw_dist),
+            frechet_distance=_compute_frechet(user.path, ref.path),
+            size_ratio=_compute_size_ratio(user, ref),
+            curvature_deviation=_compute_curvature_deviation(user, ref),
+            angle_deviation=_compute_angle_deviation(user, ref),
+            proportion_error=_compute_proportion_error(user, ref),
+        )
+        for user, dtw_dist in zip(users, dtw_dists, strict=True)
+    ]
+
+
+def _compute_dtw(seq1: np.ndarray, seq2: np.ndarray, window: int | None = None) -> float:
     """Compute Dynamic Time Warping distance between two point sequences.
 
-    Falls back to a simple numpy implementation if dtaidistance is not installed.
+    Uses dtaidistance's multi-dimensional (dependent) DTW so that x and y share
+    a single warping path. Falls back to a simple numpy implementation if
+    dtaidistance is not installed. Both backends return the square root of the
+    summed squared point distances along the warping path.
+
+    The accumulated cost grows with the number of points, so it is divided by
+    the square root of the sequence length: the result is the root-mean-square
+    per-point deviation and does not change with RESAMPLE_POINTS. Two copies
+    of a stroke offset by ``d`` are ``d`` apart.
+
+    ``window`` is the Sakoe-Chiba band half-width, as in ``_simple_dtw``.
     """
+    n = max(len(seq1), len(seq2))
     try:
-        from dtaidistance import dtw
+        from dtaidistance import dtw_ndim
+    except ImportError:
+        return _simple_dtw(seq1, seq2, window) / math.sqrt(n)
 
-        # dtaidistance expects 1D sequences, so compute on x and y separately
-        # and combine
-        dist_x = dtw.distance(seq1[:, 0].astype(np.double), seq2[:, 0].astype(np.double))
-        dist_y = dtw.distance(seq1[:, 1].astype(np.double), seq2[:, 1].astype(np.double))
-        return float((dist_x**2 + dist_y**2) ** 0.5)
+    a = np.ascontiguousarray(seq1, dtype=np.double)
+    b = np.ascontiguousarray(seq2, dtype=np.double)
+    dist = dtw_ndim.distance(a, b, use_c=True, **_dtaidistance_window(window, len(a), len(b)))
+    return float(dist) / math.sqrt(n)
+
+
+def _compute_dtw_batch(
+    batch: np.ndarray, seq: np.ndarray, window: int | None = None
+) -> np.ndarray:
+    """Length-normalized DTW distances from each sequence in a (B, T, 2) batch to ``seq``."""
+    t, m = batch.shape[1], len(seq)
+    n: int = max(t, m)
+    try:
+        from dtaidistance import dtw_ndim
     except ImportError:
-        return _simple_dtw(seq1, seq2)
+        a = np.ascontiguousarray(batch, dtype=np.float32)
+        b = np.ascontiguousarray(seq, dtype=np.float32)
+        band = n if window is None else max(window, abs(t - m))
+        dists: np.ndarray = _dtw_batch_kernel(a, b, band)
+        return dists / math.sqrt(n)
+
+    b = np.ascontiguousarray(seq, dtype=np.double)
+    kwargs = _dtaidistance_window(window, t, m)
+    dists = np.array(
+        [
+            dtw_ndim.distance(np.ascontiguousarray(a, dtype=np.double), b, use_c=True, **kwargs)
+            for a in batch
+        ],
+        dtype=np.double,
+    )
+    return dists / math.sqrt(n)
 
 
-def _simple_dtw(seq1: np.ndarray, seq2: np.ndarray) -> float:
-    """Simple DTW implementation using numpy (no external dependencies)."""
-    n, m = len(seq1), len(seq2)
-    cost = np.full((n + 1, m + 1), np.inf)
-    cost[0, 0] = 0.0
+def _dtaidistance_window(window: int | None, n: int, m: int) -> dict[str, int]:
+    """dtaidistance keyword arguments for a Sakoe-Chiba band of half-width ``window``.
 
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            d = float(np.linalg.norm(seq1[i - 1] - seq2[j - 1]))
-            cost[i, j] = d + min(cost[i - 1, j], cost[i, j - 1], cost[i - 1, j - 1])
+    dtaidistance only allows shifts strictly smaller than its ``window``, so
+    the half-width is offset by one and widened to ``|n - m|`` like the fallback.
+    """
+    if window is None:
+        return {}
+    return {"window": max(window, abs(n - m)) + 1}
 
-    return float(cost[n, m])
 
+def _simple_dtw(
+    seq1: np.ndarray,
+    seq2: np.ndarray,
+    window: int | None = None,
+) -> float:
+    """DTW fallback used when dtaidistance is not installed.
 
-def _compute_frechet(seq1: np.ndarray, seq2: np.ndarray) -> float:
-    """Compute discrete Fréchet distance between two curves."""
+    Args:
+        seq1: Array of shape (N, 2).
+        seq2: Array of shape (M, 2).
+        window: Optional Sakoe-Chiba band half-width. ``None`` computes the
+            unconstrained DTW distance. The band is widened to ``|N - M|`` if
+            needed so that a warping path always exists.
+    """
     n, m = len(seq1), len(seq2)
-    ca = np.full((n, m), -1.0)
+    band = max(n, m) if window is None else max(window, abs(n - m))
+    a = np.ascontiguousarray(seq1, dtype=np.float32)
+    b = np.ascontiguousarray(seq2, dtype=np.float32)
+    rows = _scratch_rows(m + 1)
+    return float(_dtw_kernel(a, b, band, rows[0, : m + 1], rows[1, : m + 1]))
+
 
-    def _recurse(i: int, j: int) -> float:
-        if ca[i, j] > -0.5:
-            return ca[i, j]
+# Per-thread DP rows reused across comparisons to avoid allocator churn
+_SCRATCH = threading.local()
 
-        d = float(np.linalg.norm(seq1[i] - seq2[j]))
 
-        if i == 0 and j == 0:
-            ca[i, j] = d
-        elif i > 0 and j == 0:
-            ca[i, j] = max(_recurse(i - 1, 0), d)
-        elif i == 0 and j > 0:
-            ca[i, j] = max(_recurse(0, j - 1), d)
-        else:
-            ca[i, j] = max(
-                min(_recurse(i - 1, j), _recurse(i - 1, j - 1), _recurse(i, j - 1)),
-                d,
-            )
-        return ca[i, j]
+def _scratch_rows(width: int) -> np.ndarray:
+    """Return this thread's (4, >= width) float32 scratch buffer, growing it if needed."""
+    rows: np.ndarray | None = getattr(_SCRATCH, "rows", None)
+    if rows is None or rows.shape[1] < width:
+        rows = np.empty((4, max(width, 2 * RESAMPLE_POINTS)), dtype=np.float32)
+        _SCRATCH.rows = rows
+    return rows
 
-    return _recurse(n - 1, m - 1)
 
+@njit(cache=True)
+def _dtw_kernel(
+    a: np.ndarray, b: np.ndarray, band: int, prev: np.ndarray, cur: np.ndarray
+) -> float:
+    """DTW over two (N, 2) arrays using two rolling rows of the cost matrix.
 
-def _compute_size_ratio(user: np.ndarray, ref: np.ndarray) -> float:
+    Cells accumulate squared point distances, so the only square root is the
+    one taken of the final cost. ``prev`` and ``cur`` are caller-provided
+    scratch rows of length M + 1; their contents are overwritten.
+    """
+    n, m = a.shape[0], b.shape[0]
+    prev[:] = np.inf
+    prev[0] = 0.0
+
+    for i in range(1, n + 1):
+        cur[:] = np.inf
+        ax = a[i - 1, 0]
+        ay = a[i - 1, 1]
+        for j in range(max(1, i - band), min(m, i + band) + 1):
+            dx = ax - b[j - 1, 0]
+            dy = ay - b[j - 1, 1]
+            best = prev[j - 1]
+            if prev[j] < best:
+                best = prev[j]
+            if cur[j - 1] < best:
+                best = cur[j - 1]
+            cur[j] = dx * dx + dy * dy + best
+        prev, cur = cur, prev
+
+    return math.sqrt(prev[m])
+
+
+@njit(cache=True, parallel=True)
+def _dtw_batch_kernel(batch: np.ndarray, b: np.ndarray, band: int) -> np.ndarray:
+    """Run _dtw_kernel for every sequence in a (B, T, 2) batch in parallel."""
+    m = b.shape[0]
+    out = np.empty(batch.shape[0])
+    for k in prange(batch.shape[0]):
+        prev = np.empty(m + 1, dtype=b.dtype)
+        cur = np.empty(m + 1, dtype=b.dtype)
+        out[k] = _dtw_kernel(batch[k], b, band, prev, cur)
+    return out
+
+
+def _compute_frechet(seq1: np.ndarray, seq2: np.ndarray) -> float:
+    """Compute discrete Fréchet distance between two curves.
+
+    Sweeps the coupling matrix row by row, keeping only the previous row,
+    so memory is O(m) and long strokes cannot exhaust the recursion limit.
+    The DP runs on squared distances, which preserves the max/min ordering,
+    so only the final leash length needs a square root.
+    """
+    return _run_dtw_frechet(seq1, seq2, -1)[1]
+
+
+def _compute_dtw_frechet(
+    seq1: np.ndarray, seq2: np.ndarray, window: int | None = None
+) -> tuple[float, float]:
+    """DTW (as ``_compute_dtw``) and Fréchet distances between two point sequences.
+
+    Without dtaidistance both come from one sweep of the fused kernel, which
+    computes each pairwise distance once for both recurrences.
+    """
+    try:
+        import dtaidistance  # noqa: F401
+    except ImportError:
+        n, m = len(seq1), len(seq2)
+        band = max(n, m) if window is None else max(window, abs(n - m))
+        dtw, frechet = _run_dtw_frechet(seq1, seq2, band)
+        return dtw / math.sqrt(max(n, m)), frechet
+
+    return _compute_dtw(seq1, seq2, window), _compute_frechet(seq1, seq2)
+
+
+def _run_dtw_frechet(seq1: np.ndarray, seq2: np.ndarray, band: int) -> tuple[float, float]:
+    """Run _dtw_frechet_kernel on float32 copies of two sequences with scratch rows."""
+    m = len(seq2)
+    a = np.ascontiguousarray(seq1, dtype=np.float32)
+    b = np.ascontiguousarray(seq2, dtype=np.float32)
+    rows = _scratch_rows(m + 1)
+    dtw, frechet = _dtw_frechet_kernel(
+        a, b, band, rows[0, : m + 1], rows[1, : m + 1], rows[2, :m], rows[3, :m]
+    )
+    return float(dtw), float(frechet)
+
+
+@njit(cache=True)
+def _dtw_frechet_kernel(
+    a: np.ndarray,
+    b: np.ndarray,
+    band: int,
+    dtw_prev: np.ndarray,
+    dtw_cur: np.ndarray,
+    fr_prev: np.ndarray,
+    fr_cur: np.ndarray,
+) -> tuple[float, float]:
+    """Banded DTW and discrete Fréchet distance in one sweep.
+
+    Each pairwise squared distance feeds both recurrences, and each result is
+    square-rooted once at the end: the Fréchet rows cover the whole coupling
+    matrix, the DTW rows only cells within ``band`` of the diagonal, as in
+    _dtw_kernel. A negative band skips DTW and returns inf for it. The DTW rows
+    have length M + 1, the Fréchet rows length M; all four are overwritten.
+    """
+    n, m = a.shape[0], b.shape[0]
+    dtw_prev[:] = np.inf
+    dtw_prev[0] = 0.0
+
+    for i in range(n):
+        dtw_cur[:] = np.inf
+        ax = a[i, 0]
+        ay = a[i, 1]
+        for j in range(m):
+            dx = ax - b[j, 0]
+            dy = ay - b[j, 1]
+            d2 = dx * dx + dy * dy
+
+            # Fréchet: the leash must cover this pair and the best way here
+            if i == 0 and j == 0:
+                leash = d2
+            elif i == 0:
+                leash = fr_cur[j - 1]
+            elif j == 0:
+                leash = fr_prev[0]
+            else:
+                leash = fr_prev[j - 1]
+                if fr_prev[j] < leash:
+                    leash = fr_prev[j]
+                if fr_cur[j - 1] < leash:
+                    leash = fr_cur[j - 1]
+            fr_cur[j] = d2 if d2 > leash else leash
+
+            if abs(i - j) <= band:
+                best = dtw_prev[j]
+                if dtw_prev[j + 1] < best:
+                    best = dtw_prev[j + 1]
+                if dtw_cur[j] < best:
+                    best = dtw_cur[j]
+                dtw_cur[j + 1] = d2 + best
+        dtw_prev, dtw_cur = dtw_cur, dtw_prev
+        fr_prev, fr_cur = fr_cur, fr_prev
+
+    return math.sqrt(dtw_prev[m]), math.sqrt(fr_prev[m - 1])
+
+
+def _compute_size_ratio(user: StrokeProfile, ref: StrokeProfile) -> float:
     """Compute the ratio of user stroke size to reference size."""
-    user_size = np.linalg.norm(user.max(axis=0) - user.min(axis=0))
-    ref_size = np.linalg.norm(ref.max(axis=0) - ref.min(axis=0))
-    if ref_size < 1e-8:
+    if ref.size < 1e-8:
         return 1.0
-    return float(user_size / ref_size)
+    return user.size / ref.size
 
 
-def _compute_curvature_deviation(user: np.ndarray, ref: np.ndarray) -> float:
+def _compute_curvature_deviation(user: StrokeProfile, ref: StrokeProfile) -> float:
     """Compute difference in total curvature between two strokes."""
+    return abs(user.total_curvature - ref.total_curvature)
 
-    def total_curvature(pts: np.ndarray) -> float:
-        if len(pts) < 3:
-            return 0.0
-        diffs = np.diff(pts, axis=0)
-        angles = np.arctan2(diffs[:, 1], diffs[:, 0])
-        angle_changes = np.diff(angles)
-        angle_changes = (angle_changes + np.pi) % (2 * np.pi) - np.pi
-        return float(np.abs(angle_changes).sum())
 
-    return abs(total_curvature(user) - total_curvature(ref))
+def _compute_angle_deviation(user: StrokeProfile, ref: StrokeProfile) -> float:
+    """Compute difference in start/end angles."""
+    start_dev = abs((user.start_angle - ref.start_angle + np.pi) % (2 * np.pi) - np.pi)
+    end_dev = abs((user.end_angle - ref.end_angle + np.pi) % (2 * np.pi) - np.pi)
 
+    return (start_dev + end_dev) / 2
 
-def _compute_angle_deviation(user: np.ndarray, ref: np.ndarray) -> float:
-    """Compute difference in start/end angles."""
 
-    def get_angles(pts: np.ndarray) -> tuple[float, float]:
-        if len(pts) < 2:
-            return 0.0, 0.0
-        start = np.arctan2(pts[1, 1] - pts[0, 1], pts[1, 0] - pts[0, 0])
-        end = np.arctan2(pts[-1, 1] - pts[-2, 1], pts[-1, 0] - pts[-2, 0])
-        return float(start), float(end)
+def _compute_proportion_error(user: StrokeProfile, ref: StrokeProfile) -> float:
+    """Compute difference in height/width ratios."""
+    return abs(user.aspect_ratio - ref.aspect_ratio)
 
-    u_start, u_end = get_angles(user)
-    r_start, r_end = get_angles(ref)
 
-    start_dev = abs((u_start - r_start + np.pi) % (2 * np.pi) - np.pi)
-    end_dev = abs((u_end - r_end + np.pi) % (2 * np.pi) - np.pi)
+def _resample_arclength(pts: np.ndarray, n: int) -> np.ndarray:
+    """Resample a point sequence to ``n`` points evenly spaced along its arc length.
 
-    return (start_dev + end_dev) / 2
+    Raw strokes often contain hundreds of nearly colinear points; resampling
+    bounds the quadratic DTW/Fréchet work and makes distances independent of
+    the device sampling rate.
+    """
+    seg_lengths = np.sqrt((np.diff(pts, axis=0) ** 2).sum(axis=1))
+    arc = np.concatenate(([0.0], np.cumsum(seg_lengths)))
+    if arc[-1] < 1e-12:
+        return np.repeat(pts[:1], n, axis=0)
 
+    stations = np.linspace(0.0, arc[-1], n)
+    resampled = np.empty((n, 2), dtype=pts.dtype)
+    resampled[:, 0] = np.interp(stations, arc, pts[:, 0])
+    resampled[:, 1] = np.interp(stations, arc, pts[:, 1])
+    return resampled
 
-def _compute_proportion_error(user: np.ndarray, ref: np.ndarray) -> float:
-    """Compute difference in height/width ratios."""
 
-    def aspect_ratio(pts: np.ndarray) -> float:
-        extents = pts.max(axis=0) - pts.min(axis=0)
-        if extents[0] < 1e-8:
-            return 0.0
-        return float(extents[1] / extents[0])
+def _bbox_stats(pts: np.ndarray) -> tuple[float, float]:
+    """Bounding-box diagonal and height/width ratio of a point sequence.
 
-    return abs(aspect_ratio(user) - aspect_ratio(ref))
+    The aspect ratio is 0.0 for strokes with no width.
+    """
+    extents = pts.max(axis=0) - pts.min(axis=0)
+    size = math.hypot(extents[0], extents[1])
+    aspect_ratio = float(extents[1] / extents[0]) if extents[0] >= 1e-8 else 0.0
+    return size, aspect_ratio
+
+
+def _total_curvature(pts: np.ndarray) -> float:
+    """Sum of absolute turning angles along a point sequence."""
+    if len(pts) < 3:
+        return 0.0
+    diffs = np.diff(pts, axis=0)
+    angles = np.arctan2(diffs[:, 1], diffs[:, 0])
+    return float(np.abs(np.diff(np.unwrap(angles))).sum())
+
+
+def batch_total_curvature(strokes: list[np.ndarray]) -> np.ndarray:
+    """Total curvature of many strokes with a single arctan2 pass.
+
+    Equivalent to computing the sum of absolute turning angles of each stroke
+    separately, but concatenates all strokes so the trigonometry runs once.
+
+    Args:
+        strokes: Point arrays of shape (N_i, 2).
+
+    Returns:
+        Array of shape (len(strokes),); strokes with fewer than 3 points get 0.
+    """
+    if not strokes:
+        return np.zeros(0)
+
+    lengths = np.array([len(pts) for pts in strokes])
+    seg_counts = np.maximum(lengths - 1, 0)
+    turn_counts = np.maximum(lengths - 2, 0)
+
+    # Segment directions, dropping the bogus segments between strokes
+    points = np.concatenate([pts[:, :2] for pts in strokes])
+    diffs = np.diff(points, axis=0)
+    boundaries = np.cumsum(lengths)[:-1] - 1
+    keep = np.ones(len(diffs), dtype=bool)
+    keep[boundaries[(boundaries >= 0) & (boundaries < len(diffs))]] = False
+    angles = np.arctan2(diffs[keep, 1], diffs[keep, 0])
+
+    # Turning angles, dropping those between the last segment of one stroke
+    # and the first segment of the next
+    changes = np.diff(angles)
+    seg_ends = np.cumsum(seg_counts)[:-1] - 1
+    keep = np.ones(len(changes), dtype=bool)
+    keep[seg_ends[(seg_ends >= 0) & (seg_ends < len(changes))]] = False
+    changes = (changes[keep] + np.pi) % (2 * np.pi) - np.pi
+
+    stroke_ids = np.repeat(np.arange(len(strokes)), turn_counts)
+    return np.bincount(stroke_ids, weights=np.abs(changes), minlength=len(strokes))
+
+
+def _end_angles(pts: np.ndarray) -> tuple[float, float]:
+    """Direction of the first and last segments of a point sequence."""
+    if len(pts) < 2:
+        return 0.0, 0.0
+    start = np.arctan2(pts[1, 1] - pts[0, 1], pts[1, 0] - pts[0, 0])
+    end = np.arctan2(pts[-1, 1] - pts[-2, 1], pts[-1, 0] - pts[-2, 0])
+    return float(start), float(end)
@@ -5,9 +5,74 @@ Translates numerical deviations into actionable practice advice.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from rm_greg.feedback.comparison import StrokeComparison
 from rm_greg.feedback.scoring import AttemptScore, score_attempt
 
+# A rule fires when its predicate holds and renders its message for the label
+Predicate = Callable[[StrokeComparison, AttemptScore], bool]
+Message = Callable[[StrokeComparison, str], str]
+
+# Evaluated in order, so the most important feedback comes first
+RULES: tuple[tuple[Predicate, Message], ...] = (
+    # Overall assessment
+    (
+        lambda c, s: s.overall_score >= 0.9,
+        lambda c, label: f"Your '{label}' stroke looks good.",
+    ),
+    (
+        lambda c, s: 0.7 <= s.overall_score < 0.9,
+        lambda c, label: f"Your '{label}' is recognizable but could be improved.",
+    ),
+    (
+        lambda c, s: s.overall_score < 0.7,
+        lambda c, label: f"Your '{label}' needs more practice. Here's what to focus on:",
+    ),
+    # Size
+    (
+        lambda c, s: c.size_ratio > 1.3,
+        lambda c, label: (
+            f"Your '{label}' is too large — try making it about {c.size_ratio:.0%} smaller."
+        ),
+    ),
+    (
+        lambda c, s: c.size_ratio < 0.7,
+        lambda c, label: (
+            f"Your '{label}' is too small — try making it about {1 / c.size_ratio:.0%} larger."
+        ),
+    ),
+    # Angle
+    (
+        lambda c, s: c.angle_deviation > 0.3,
+        lambda c, label: (
+            "The starting angle is off — check the reference and "
+            "try to match the entry direction."
+        ),
+    ),
+    # Curvature
+    (
+        lambda c, s: c.curvature_deviation > 0.5,
+        lambda c, label: "The curve should be smoother — try to maintain a consistent arc.",
+    ),
+    # Proportion
+    (
+        lambda c, s: c.proportion_error > 0.3,
+        lambda c, label: (
+            "The height-to-width ratio doesn't match the reference. "
+            "Pay attention to the proportions."
+        ),
+    ),
+    # Shape (DTW)
+    (
+        lambda c, s: s.shape_score < 0.6,
+        lambda c, label: (
+            "The overall shape is quite different from the reference. "
+            "Try tracing the reference stroke a few times first."
+        ),
+    ),
+)
+
 
 def generate_feedback(
     comparison: StrokeComparison,
@@ -27,54 +92,8 @@ def generate_feedback(
     if score is None:
         score = score_attempt(comparison)
 
-    feedback: list[str] = []
-
-    # Overall assessment
-    if score.overall_score >= 0.9:
-        feedback.append(f"Your '{label}' stroke looks good.")
-    elif score.overall_score >= 0.7:
-        feedback.append(f"Your '{label}' is recognizable but could be improved.")
-    else:
-        feedback.append(f"Your '{label}' needs more practice. Here's what to focus on:")
-
-    # Size feedback
-    if comparison.size_ratio > 1.3:
-        feedback.append(
-            f"Your '{label}' is too large — try making it about "
-            f"{comparison.size_ratio:.0%} smaller."
-        )
-    elif comparison.size_ratio < 0.7:
-        feedback.append(
-            f"Your '{label}' is too small — try making it about "
-            f"{1 / comparison.size_ratio:.0%} larger."
-        )
-
-    # Angle feedback
-    if comparison.angle_deviation > 0.3:
-        feedback.append(
-            "The starting angle is off — check the reference and "
-            "try to match the entry direction."
-        )
-
-    # Curvature feedback
-    if comparison.curvature_deviation > 0.5:
-        if comparison.curvature_deviation > 0:
-            feedback.append(
-                "The curve should be smoother — try to maintain a consistent arc."
-            )
-
-    # Proportion feedback
-    if comparison.proportion_error > 0.3:
-        feedback.append(
-            "The height-to-width ratio doesn't match the reference. "
-            "Pay attention to the proportions."
-        )
-
-    # Shape feedback (DTW)
-    if score.shape_score < 0.6:
-        feedback.append(
-            "The overall shape is quite different from the reference. "
-            "Try tracing the reference stroke a few times first."
-        )
-
-    return feedback
+    return [
+        message(comparison, label)
+        for predicate, message in RULES
+        if predicate(comparison, score)
+    ]
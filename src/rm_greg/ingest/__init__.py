@@ -1,5 +1,10 @@
 """Data ingestion module: extract stroke data from reMarkable .rm files."""
 
-from rm_greg.ingest.extractor import extract_page, extract_notebook
+from rm_greg.ingest.extractor import (
+    extract_notebook,
+    extract_page,
+    extract_page_async,
+    extract_pages_async,
+)
 
-__all__ = ["extract_page", "extract_notebook"]
+__all__ = ["extract_page", "extract_notebook", "extract_page_async", "extract_pages_async"]
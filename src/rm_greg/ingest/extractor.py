@@ -6,6 +6,9 @@ and converts them into our internal Stroke/Point data model.
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from rm_greg.models import PageData, Point, Stroke, StrokeColor, PenType
@@ -47,19 +50,18 @@ def extract_page(rm_file: Path) -> PageData:
                 continue
 
             line = item.value
-            points: list[Point] = []
-            for pt in line.points:
-                points.append(
-                    Point(
-                        x=pt.x,
-                        y=pt.y,
-                        speed=pt.speed,
-                        direction=pt.direction,
-                        width=pt.width,
-                        pressure=pt.pressure,
-                        tilt=pt.tilt,
-                    )
+            points = [
+                Point(
+                    x=pt.x,
+                    y=pt.y,
+                    speed=pt.speed,
+                    direction=pt.direction,
+                    width=pt.width,
+                    pressure=pt.pressure,
+                    tilt=pt.tilt,
                 )
+                for pt in line.points
+            ]
 
             if points:
                 strokes.append(
@@ -74,29 +76,63 @@ def extract_page(rm_file: Path) -> PageData:
     return PageData(page_id=page_id, strokes=strokes)
 
 
-def extract_notebook(notebook_dir: Path) -> list[PageData]:
+def extract_notebook(notebook_dir: Path, max_workers: int | None = None) -> list[PageData]:
     """Extract stroke data from all pages in a reMarkable notebook directory.
 
+    Pages are independent, so they are parsed in parallel worker processes.
+
     Args:
         notebook_dir: Path to the notebook directory containing .rm files.
+        max_workers: Maximum number of worker processes. Defaults to the
+            number of CPUs; 1 parses pages sequentially in this process.
 
     Returns:
-        List of PageData, one per page.
+        List of PageData, one per page, in filename order.
     """
     if not notebook_dir.is_dir():
         raise NotADirectoryError(f"Not a directory: {notebook_dir}")
 
-    pages = []
-    for rm_file in sorted(notebook_dir.glob("*.rm")):
-        pages.append(extract_page(rm_file))
-    return pages
+    rm_files = sorted(notebook_dir.glob("*.rm"))
+    if max_workers == 1 or len(rm_files) <= 1:
+        return [extract_page(rm_file) for rm_file in rm_files]
+
+    # Spawn rather than fork: forking a process whose Numba thread pool has
+    # already started can deadlock the children
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        return list(executor.map(extract_page, rm_files))
+
+
+async def extract_page_async(rm_file: Path) -> PageData:
+    """Extract a page in a worker thread without blocking the event loop.
+
+    Args:
+        rm_file: Path to a .rm binary file (v6 format).
+
+    Returns:
+        PageData containing all strokes and points from the page.
+    """
+    return await asyncio.to_thread(extract_page, rm_file)
+
+
+async def extract_pages_async(rm_files: list[Path]) -> list[PageData]:
+    """Extract several pages concurrently, overlapping file I/O with parsing.
+
+    Args:
+        rm_files: Paths to .rm binary files (v6 format).
+
+    Returns:
+        List of PageData in the same order as ``rm_files``.
+    """
+    return list(await asyncio.gather(*(extract_page_async(f) for f in rm_files)))
+
+
+# rmscene color integers, indexed by value
+_COLORS = (StrokeColor.BLACK, StrokeColor.GREY, StrokeColor.WHITE)
 
 
 def _map_color(color_value: int) -> StrokeColor:
     """Map rmscene color integer to our StrokeColor enum."""
-    color_map = {
-        0: StrokeColor.BLACK,
-        1: StrokeColor.GREY,
-        2: StrokeColor.WHITE,
-    }
-    return color_map.get(color_value, StrokeColor.BLACK)
+    if 0 <= color_value < len(_COLORS):
+        return _COLORS[color_value]
+    return StrokeColor.BLACK
@@ -7,9 +7,15 @@ stroke data, points, and practice sessions.
 from __future__ import annotations
 
 from enum import Enum
+from operator import attrgetter
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+# Point attributes held in NormalizedStroke.array, in column order
+_ARRAY_COLUMNS = ("x", "y", "pressure", "tilt", "speed", "direction")
+_ARRAY_GETTER = attrgetter(*_ARRAY_COLUMNS)
+
 
 class PenType(str, Enum):
     """reMarkable pen types."""
@@ -67,12 +73,94 @@ class NormalizedPoint(BaseModel):
     timestamp: float = Field(default=0.0)
 
 
+class _ArrayCache:
+    """Holder for a stroke's cached array that never affects model equality.
+
+    Pydantic compares instance ``__dict__`` values, and ndarrays do not
+    compare to a single bool. The points list the array was built from is
+    kept so that a replaced or resized list invalidates the cache.
+    """
+
+    __slots__ = ("points", "value")
+
+    def __init__(self, points: list[NormalizedPoint], value: np.ndarray) -> None:
+        self.points = points
+        self.value = value
+
+    def matches(self, points: list[NormalizedPoint]) -> bool:
+        """Whether the cached array was built from this points list at its current length."""
+        return self.points is points and self.value.shape[0] == len(points)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ArrayCache)
+
+
 class NormalizedStroke(BaseModel):
     """A stroke with normalized coordinates."""
 
     points: list[NormalizedPoint] = Field(default_factory=list)
     label: str | None = Field(default=None, description="Gregg shorthand label if known")
 
+    @classmethod
+    def from_array(
+        cls,
+        array: np.ndarray,
+        timestamps: np.ndarray | None = None,
+        label: str | None = None,
+    ) -> NormalizedStroke:
+        """Build a stroke from point columns, priming its ``array`` cache.
+
+        Args:
+            array: Array of shape (N, 6) with columns
+                [x, y, pressure, tilt, speed, direction].
+            timestamps: Optional array of shape (N,). Defaults to zeros.
+            label: Gregg shorthand label if known.
+
+        Returns:
+            NormalizedStroke whose ``array`` needs no rebuild from its points.
+        """
+        rows = array.tolist()
+        times = timestamps.tolist() if timestamps is not None else [0.0] * len(rows)
+        points = [
+            NormalizedPoint(
+                x=x,
+                y=y,
+                pressure=pressure,
+                tilt=tilt,
+                speed=speed,
+                direction=direction,
+                timestamp=timestamp,
+            )
+            for (x, y, pressure, tilt, speed, direction), timestamp in zip(rows, times)
+        ]
+        stroke = cls(points=points, label=label)
+        cached = np.array(array, dtype=np.float32).reshape(len(rows), len(_ARRAY_COLUMNS))
+        cached.flags.writeable = False
+        stroke.__dict__["_array_cache"] = _ArrayCache(stroke.points, cached)
+        return stroke
+
+    @property
+    def array(self) -> np.ndarray:
+        """Point columns [x, y, pressure, tilt, speed, direction] as a float32 array.
+
+        Built from ``points`` on first access and cached on the instance. The
+        array is read-only and shared, so callers that need to modify it must
+        copy it. The cache is rebuilt when ``points`` is reassigned (including
+        through ``model_copy(update=...)``) or changes length; points edited in
+        place are not detected.
+        """
+        cache = self.__dict__.get("_array_cache")
+        if cache is None or not cache.matches(self.points):
+            n = len(self.points)
+            array = np.fromiter(
+                (v for p in self.points for v in _ARRAY_GETTER(p)),
+                dtype=np.float32,
+                count=n * len(_ARRAY_COLUMNS),
+            ).reshape(n, len(_ARRAY_COLUMNS))
+            array.flags.writeable = False
+            cache = self.__dict__["_array_cache"] = _ArrayCache(self.points, array)
+        return cache.value
+
 
 class PageData(BaseModel):
     """All stroke data from a single reMarkable page."""
@@ -2,6 +2,14 @@
 
 from rm_greg.preprocessing.normalize import normalize_strokes
 from rm_greg.preprocessing.segment import segment_glyphs
-from rm_greg.preprocessing.features import extract_geometric_features
+from rm_greg.preprocessing.features import (
+    extract_geometric_features,
+    extract_geometric_features_batch,
+)
 
-__all__ = ["normalize_strokes", "segment_glyphs", "extract_geometric_features"]
+__all__ = [
+    "normalize_strokes",
+    "segment_glyphs",
+    "extract_geometric_features",
+    "extract_geometric_features_batch",
+]
@@ -6,12 +6,20 @@ These features capture the shape, size, and dynamics of Gregg shorthand strokes.
 
 from __future__ import annotations
 
+import math
+import threading
 from dataclasses import dataclass
 
 import numpy as np
 
+from rm_greg._jit import HAS_NUMBA, njit, prange
 from rm_greg.models import NormalizedStroke
-from rm_greg.preprocessing.normalize import stroke_to_array
+
+# Length of GeometricFeatures.to_array()
+N_FEATURES = 15
+
+# Odd minimax polynomial for atan on [0, 1], max error ~2e-6 rad
+_ATAN_COEFFS = (0.99997726, -0.33262347, 0.19354346, -0.11643287, 0.05265332, -0.01172120)
 
 
 @dataclass
@@ -66,10 +74,20 @@ class GeometricFeatures:
             dtype=np.float32,
         )
 
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> GeometricFeatures:
+        """Build features from a flat array in ``to_array`` order."""
+        fields = values.tolist()
+        fields[11] = int(fields[11])  # n_points
+        return cls(*fields)
+
 
 def extract_geometric_features(stroke: NormalizedStroke) -> GeometricFeatures:
     """Extract geometric features from a normalized stroke.
 
+    With Numba installed this runs the compiled single-pass kernel shared with
+    ``extract_geometric_features_batch``; otherwise it uses NumPy.
+
     Args:
         stroke: A normalized stroke with points in [0, 1] coordinate space.
 
@@ -82,7 +100,12 @@ def extract_geometric_features(stroke: NormalizedStroke) -> GeometricFeatures:
     if len(stroke.points) < 2:
         raise ValueError("Stroke must have at least 2 points for feature extraction")
 
-    arr = stroke_to_array(stroke)
+    arr = stroke.array
+    if HAS_NUMBA:
+        out = np.empty((1, N_FEATURES), dtype=np.float32)
+        _features_kernel(arr, np.array([0, len(arr)], dtype=np.intp), out)
+        return GeometricFeatures.from_array(out[0])
+
     xy = arr[:, :2]  # x, y columns
     pressures = arr[:, 2]
     speeds = arr[:, 4]
@@ -94,9 +117,16 @@ def extract_geometric_features(stroke: NormalizedStroke) -> GeometricFeatures:
     bbox_height = maxs[1] - mins[1]
     bbox_aspect_ratio = bbox_width / bbox_height if bbox_height > 1e-8 else 0.0
 
+    # Segment vectors, lengths, and directions go into rows of a reused
+    # per-thread buffer instead of fresh temporaries
+    n_seg = len(arr) - 1
+    buf = _scratch_rows(n_seg)
+    dx, dy, segment_lengths, angles = buf[0, :n_seg], buf[1, :n_seg], buf[2, :n_seg], buf[3, :n_seg]
+    np.subtract(xy[1:, 0], xy[:-1, 0], out=dx)
+    np.subtract(xy[1:, 1], xy[:-1, 1], out=dy)
+
     # Arc length (sum of segment lengths)
-    diffs = np.diff(xy, axis=0)
-    segment_lengths = np.linalg.norm(diffs, axis=1)
+    np.hypot(dx, dy, out=segment_lengths)
     total_arc_length = float(segment_lengths.sum())
 
     # Direct distance (start to end)
@@ -104,16 +134,19 @@ def extract_geometric_features(stroke: NormalizedStroke) -> GeometricFeatures:
     straightness = direct_distance / total_arc_length if total_arc_length > 1e-8 else 1.0
 
     # Angles
-    angles = np.arctan2(diffs[:, 1], diffs[:, 0])
+    np.arctan2(dy, dx, out=angles)
     start_angle = float(angles[0])
     end_angle = float(angles[-1])
 
-    # Angle changes (curvature proxy)
-    angle_diffs = np.diff(angles)
-    # Wrap to [-pi, pi]
-    angle_diffs = (angle_diffs + np.pi) % (2 * np.pi) - np.pi
-    total_angle_change = float(np.abs(angle_diffs).sum())
-    mean_curvature = float(np.abs(angle_diffs).mean()) if len(angle_diffs) > 0 else 0.0
+    # Angle changes (curvature proxy), wrapped to [-pi, pi]; the dx row is free again
+    abs_turns = buf[0, : n_seg - 1]
+    np.subtract(angles[1:], angles[:-1], out=abs_turns)
+    abs_turns += np.pi
+    np.remainder(abs_turns, 2 * np.pi, out=abs_turns)
+    abs_turns -= np.pi
+    np.abs(abs_turns, out=abs_turns)
+    total_angle_change = float(abs_turns.sum())
+    mean_curvature = float(abs_turns.mean()) if n_seg > 1 else 0.0
 
     # Height/width ratio
     stroke_height_ratio = bbox_height / bbox_width if bbox_width > 1e-8 else 0.0
@@ -135,3 +168,222 @@ def extract_geometric_features(stroke: NormalizedStroke) -> GeometricFeatures:
         std_pressure=float(pressures.std()),
         mean_speed=float(speeds.mean()),
     )
+
+
+# Per-thread rows reused by extract_geometric_features to avoid allocator churn
+_SCRATCH = threading.local()
+
+
+def _scratch_rows(width: int) -> np.ndarray:
+    """Return this thread's (4, >= width) float32 scratch buffer, growing it if needed."""
+    rows: np.ndarray | None = getattr(_SCRATCH, "rows", None)
+    if rows is None or rows.shape[1] < width:
+        rows = np.empty((4, max(width, 256)), dtype=np.float32)
+        _SCRATCH.rows = rows
+    return rows
+
+
+def extract_geometric_features_batch(strokes: list[NormalizedStroke]) -> np.ndarray:
+    """Extract geometric features for many strokes at once.
+
+    Equivalent to stacking ``extract_geometric_features(s).to_array()`` for each
+    stroke, but packs all strokes into one array and computes every feature with
+    a single vectorized pass over it.
+
+    Args:
+        strokes: Normalized strokes, each with at least 2 points.
+
+    Returns:
+        Array of shape (len(strokes), 15), dtype float32, with columns in
+        GeometricFeatures.to_array order.
+
+    Raises:
+        ValueError: If any stroke has fewer than 2 points.
+    """
+    if any(len(s.points) < 2 for s in strokes):
+        raise ValueError("Stroke must have at least 2 points for feature extraction")
+    if not strokes:
+        return np.zeros((0, N_FEATURES), dtype=np.float32)
+
+    arrays = [s.array for s in strokes]
+    arr = np.concatenate(arrays)
+    offsets = np.zeros(len(strokes) + 1, dtype=np.intp)
+    np.cumsum([a.shape[0] for a in arrays], out=offsets[1:])
+    if HAS_NUMBA:
+        out = np.empty((len(strokes), N_FEATURES), dtype=np.float32)
+        _features_kernel(arr, offsets, out)
+        return out
+    return _packed_geometric_features(arr, offsets)
+
+
+def _packed_geometric_features(arr: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Geometric features of strokes packed as rows ``offsets[i]:offsets[i + 1]`` of arr."""
+    starts, ends = offsets[:-1], offsets[1:]
+    counts = ends - starts
+    xy = arr[:, :2]
+    pressures = arr[:, 2]
+    speeds = arr[:, 4]
+
+    # Bounding box
+    mins = np.minimum.reduceat(xy, starts, axis=0)
+    maxs = np.maximum.reduceat(xy, starts, axis=0)
+    bbox_width = maxs[:, 0] - mins[:, 0]
+    bbox_height = maxs[:, 1] - mins[:, 1]
+    bbox_aspect_ratio = _safe_ratio(bbox_width, bbox_height, 0.0)
+
+    # Segments; the one joining the end of a stroke to the start of the next
+    # is zeroed, and arrays are padded so reduceat indices stay in range
+    diffs = np.diff(xy, axis=0)
+    segment_lengths = np.zeros(len(xy), dtype=xy.dtype)
+    segment_lengths[:-1] = np.linalg.norm(diffs, axis=1)
+    segment_lengths[ends[:-1] - 1] = 0.0
+    total_arc_length = np.add.reduceat(segment_lengths, starts)
+
+    direct_distance = np.linalg.norm(xy[ends - 1] - xy[starts], axis=1)
+    straightness = _safe_ratio(direct_distance, total_arc_length, 1.0)
+
+    # Angles
+    angles = np.arctan2(diffs[:, 1], diffs[:, 0])
+    start_angle = angles[starts]
+    end_angle = angles[ends - 2]
+
+    # Turning angles; the two that involve a cross-stroke segment are zeroed
+    angle_diffs = np.zeros(len(xy), dtype=angles.dtype)
+    angle_diffs[:-2] = np.abs((np.diff(angles) + np.pi) % (2 * np.pi) - np.pi)
+    angle_diffs[ends - 2] = 0.0
+    angle_diffs[ends - 1] = 0.0
+    total_angle_change = np.add.reduceat(angle_diffs, starts)
+    n_turns = counts - 2
+    mean_curvature = np.where(n_turns > 0, total_angle_change / np.maximum(n_turns, 1), 0.0)
+
+    stroke_height_ratio = _safe_ratio(bbox_height, bbox_width, 0.0)
+
+    # Pressure/dynamics
+    mean_pressure = np.add.reduceat(pressures, starts) / counts
+    centered = pressures - np.repeat(mean_pressure, counts)
+    std_pressure = np.sqrt(np.add.reduceat(centered * centered, starts) / counts)
+    mean_speed = np.add.reduceat(speeds, starts) / counts
+
+    return np.column_stack(
+        [
+            bbox_width,
+            bbox_height,
+            bbox_aspect_ratio,
+            total_arc_length,
+            direct_distance,
+            straightness,
+            start_angle,
+            end_angle,
+            total_angle_change,
+            mean_curvature,
+            stroke_height_ratio,
+            counts,
+            mean_pressure,
+            std_pressure,
+            mean_speed,
+        ]
+    ).astype(np.float32)
+
+
+def _safe_ratio(num: np.ndarray, den: np.ndarray, default: float) -> np.ndarray:
+    """Elementwise num / den, or ``default`` where den is (near) zero."""
+    ok = den > 1e-8
+    return np.where(ok, num / np.where(ok, den, 1.0), default)
+
+
+@njit(cache=True, parallel=True)
+def _features_kernel(arr: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    """Compiled counterpart of _packed_geometric_features, writing into ``out``.
+
+    Each stroke is handled in one sweep over its points that accumulates every
+    feature at once, so no per-feature temporaries are allocated. Strokes are
+    processed in parallel.
+    """
+    for s in prange(len(offsets) - 1):
+        i0 = offsets[s]
+        i1 = offsets[s + 1]
+        n = i1 - i0
+
+        min_x = max_x = arr[i0, 0]
+        min_y = max_y = arr[i0, 1]
+        arc_length = 0.0
+        angle_change = 0.0
+        pressure_sum = 0.0
+        speed_sum = 0.0
+        start_angle = 0.0
+        angle = 0.0
+        for i in range(i0, i1):
+            x = arr[i, 0]
+            y = arr[i, 1]
+            min_x = min(min_x, x)
+            max_x = max(max_x, x)
+            min_y = min(min_y, y)
+            max_y = max(max_y, y)
+            pressure_sum += arr[i, 2]
+            speed_sum += arr[i, 4]
+            if i + 1 < i1:
+                dx = arr[i + 1, 0] - x
+                dy = arr[i + 1, 1] - y
+                arc_length += math.sqrt(dx * dx + dy * dy)
+                next_angle = _fast_atan2(dy, dx)
+                if i == i0:
+                    start_angle = next_angle
+                else:
+                    # Wrap to [-pi, pi]
+                    turn = (next_angle - angle + math.pi) % (2 * math.pi) - math.pi
+                    angle_change += abs(turn)
+                angle = next_angle
+
+        mean_pressure = pressure_sum / n
+        pressure_var = 0.0
+        for i in range(i0, i1):
+            d = arr[i, 2] - mean_pressure
+            pressure_var += d * d
+
+        width = max_x - min_x
+        height = max_y - min_y
+        dx = arr[i1 - 1, 0] - arr[i0, 0]
+        dy = arr[i1 - 1, 1] - arr[i0, 1]
+        direct_distance = math.sqrt(dx * dx + dy * dy)
+
+        out[s, 0] = width
+        out[s, 1] = height
+        out[s, 2] = width / height if height > 1e-8 else 0.0
+        out[s, 3] = arc_length
+        out[s, 4] = direct_distance
+        out[s, 5] = direct_distance / arc_length if arc_length > 1e-8 else 1.0
+        out[s, 6] = start_angle
+        out[s, 7] = angle
+        out[s, 8] = angle_change
+        out[s, 9] = angle_change / (n - 2) if n > 2 else 0.0
+        out[s, 10] = height / width if width > 1e-8 else 0.0
+        out[s, 11] = n
+        out[s, 12] = mean_pressure
+        out[s, 13] = math.sqrt(pressure_var / n)
+        out[s, 14] = speed_sum / n
+
+
+@njit(cache=True)
+def _fast_atan2(y: float, x: float) -> float:
+    """Polynomial approximation of ``math.atan2`` for compiled kernels.
+
+    Reduces the argument to ``a = min(|x|, |y|) / max(|x|, |y|)`` in [0, 1],
+    evaluates the atan polynomial there and restores the octant from the
+    signs. Branch-light and free of libm calls, so Numba can vectorize loops
+    that use it. NumPy code should keep ``np.arctan2``, which is already a
+    SIMD ufunc.
+    """
+    c0, c1, c2, c3, c4, c5 = _ATAN_COEFFS
+    ax = abs(x)
+    ay = abs(y)
+    swap = ay > ax
+    num = ax if swap else ay
+    den = ay if swap else ax
+    a = num / den if den > 0.0 else 0.0
+    a2 = a * a
+    r = a * (c0 + a2 * (c1 + a2 * (c2 + a2 * (c3 + a2 * (c4 + a2 * c5)))))
+    if swap:
+        r = 0.5 * math.pi - r
+    if x < 0.0:
+        r = math.pi - r
+    return math.copysign(r, y)
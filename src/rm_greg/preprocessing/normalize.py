@@ -6,12 +6,15 @@ This module normalizes coordinates to [0, 1] for ML consumption.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from operator import attrgetter
+
 import numpy as np
 
 from rm_greg.models import (
-    NormalizedPoint,
     NormalizedStroke,
     PageData,
+    Point,
     Stroke,
 )
 
@@ -19,12 +22,21 @@ from rm_greg.models import (
 RM_WIDTH = 1404.0
 RM_HEIGHT = 1872.0
 
+# Reciprocals, so normalization multiplies instead of divides
+_INV_RM_WIDTH = 1.0 / RM_WIDTH
+_INV_RM_HEIGHT = 1.0 / RM_HEIGHT
+_INV_RM_SIZE = np.array([_INV_RM_WIDTH, _INV_RM_HEIGHT])
+
+# Columns of the packed arrays built by normalize_page_array
+NORMALIZED_COLUMNS = ("x", "y", "pressure", "tilt", "speed", "direction", "timestamp")
+_NORMALIZED_GETTER = attrgetter(*NORMALIZED_COLUMNS)
+
 
 def normalize_point_coords(x: float, y: float) -> tuple[float, float]:
     """Normalize raw reMarkable coordinates to [0, 1] range."""
     return (
-        max(0.0, min(1.0, x / RM_WIDTH)),
-        max(0.0, min(1.0, y / RM_HEIGHT)),
+        max(0.0, min(1.0, x * _INV_RM_WIDTH)),
+        max(0.0, min(1.0, y * _INV_RM_HEIGHT)),
     )
 
 
@@ -37,21 +49,7 @@ def normalize_stroke(stroke: Stroke) -> NormalizedStroke:
     Returns:
         NormalizedStroke with coordinates in [0, 1].
     """
-    normalized_points = []
-    for pt in stroke.points:
-        nx, ny = normalize_point_coords(pt.x, pt.y)
-        normalized_points.append(
-            NormalizedPoint(
-                x=nx,
-                y=ny,
-                pressure=pt.pressure,
-                tilt=pt.tilt,
-                speed=pt.speed,
-                direction=pt.direction,
-                timestamp=pt.timestamp,
-            )
-        )
-    return NormalizedStroke(points=normalized_points)
+    return _stroke_from_array(_normalize_points(stroke.points))
 
 
 def normalize_strokes(page: PageData) -> list[NormalizedStroke]:
@@ -63,22 +61,72 @@ def normalize_strokes(page: PageData) -> list[NormalizedStroke]:
     Returns:
         List of normalized strokes.
     """
-    return [normalize_stroke(s) for s in page.strokes]
+    arr, offsets = normalize_page_array(page)
+    return [_stroke_from_array(arr[start:end]) for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def normalize_page_array(page: PageData) -> tuple[np.ndarray, np.ndarray]:
+    """Normalize all points of a page into one packed array.
+
+    Args:
+        page: Raw page data from the extractor.
+
+    Returns:
+        Tuple of (points, offsets). ``points`` has shape (N_total, 7) with
+        columns in NORMALIZED_COLUMNS order; stroke ``i`` occupies rows
+        ``offsets[i]:offsets[i + 1]``.
+    """
+    offsets = np.zeros(len(page.strokes) + 1, dtype=np.intp)
+    np.cumsum([len(s.points) for s in page.strokes], out=offsets[1:])
+    arr = _normalize_points([p for s in page.strokes for p in s.points])
+    return arr, offsets
+
+
+def _normalize_points(points: list[Point]) -> np.ndarray:
+    """Pack raw points into an (N, 7) float64 array with x, y scaled to [0, 1]."""
+    n = len(points)
+    arr = np.fromiter(
+        (v for p in points for v in _NORMALIZED_GETTER(p)),
+        dtype=np.float64,
+        count=n * len(NORMALIZED_COLUMNS),
+    ).reshape(n, len(NORMALIZED_COLUMNS))
+
+    xy = arr[:, :2]
+    np.multiply(xy, _INV_RM_SIZE, out=xy)
+    np.clip(xy, 0.0, 1.0, out=xy)
+    return arr
+
+
+def _stroke_from_array(arr: np.ndarray) -> NormalizedStroke:
+    """Build a NormalizedStroke from rows in NORMALIZED_COLUMNS order."""
+    return NormalizedStroke.from_array(arr[:, :6], timestamps=arr[:, 6])
 
 
 def stroke_to_array(stroke: NormalizedStroke) -> np.ndarray:
     """Convert a normalized stroke to a numpy array.
 
-    Returns an array of shape (N, 6) where columns are:
-    [x, y, pressure, tilt, speed, direction]
+    Returns a writable copy of the stroke's cached array, of shape (N, 6) where
+    columns are: [x, y, pressure, tilt, speed, direction]
     """
-    return np.array(
-        [
-            [p.x, p.y, p.pressure, p.tilt, p.speed, p.direction]
-            for p in stroke.points
-        ],
-        dtype=np.float32,
-    )
+    return stroke.array.copy()
+
+
+def strokes_to_array(strokes: list[NormalizedStroke]) -> np.ndarray:
+    """Convert equal-length normalized strokes to one stacked numpy array.
+
+    Returns an array of shape (B, N, 6) with the same columns as
+    stroke_to_array.
+
+    Raises:
+        ValueError: If the strokes do not all have the same number of points.
+    """
+    n = len(strokes[0].points) if strokes else 0
+    if any(len(s.points) != n for s in strokes):
+        raise ValueError("All strokes must have the same number of points")
+    if not strokes:
+        return np.zeros((0, 0, 6), dtype=np.float32)
+
+    return np.stack([s.array for s in strokes])
 
 
 def interpolate_stroke(
@@ -88,23 +136,41 @@ def interpolate_stroke(
     """Resample a stroke to a fixed number of points via linear interpolation.
 
     This is useful for feeding strokes into fixed-length neural network inputs.
+    A stack of equal-length strokes of shape (B, N, D) is resampled in one call.
 
     Args:
-        stroke_array: Array of shape (N, D) where N is variable length.
+        stroke_array: Array of shape (N, D) or (B, N, D) where N is variable length.
         target_length: Desired output length.
 
     Returns:
-        Array of shape (target_length, D).
+        Array of shape (target_length, D), or (B, target_length, D).
     """
-    n_points, n_features = stroke_array.shape
+    n_points = stroke_array.shape[-2]
     if n_points == target_length:
         return stroke_array
 
-    old_indices = np.linspace(0, 1, n_points)
-    new_indices = np.linspace(0, 1, target_length)
+    if n_points == 1:
+        return np.repeat(stroke_array.astype(np.float32), target_length, axis=-2)
 
-    result = np.zeros((target_length, n_features), dtype=np.float32)
-    for col in range(n_features):
-        result[:, col] = np.interp(new_indices, old_indices, stroke_array[:, col])
+    idx, weights = _interp_plan(n_points, target_length)
+    lo = stroke_array[..., idx, :]
+    hi = stroke_array[..., idx + 1, :]
+    resampled: np.ndarray = (lo + weights[:, None] * (hi - lo)).astype(np.float32)
+    return resampled
 
-    return result
+
+@lru_cache(maxsize=512)
+def _interp_plan(n_points: int, target_length: int) -> tuple[np.ndarray, np.ndarray]:
+    """Gather indices and blend weights for resampling n_points to target_length.
+
+    Both sample grids are uniform, so output sample ``k`` sits at position
+    ``k * (n_points - 1) / (target_length - 1)`` of the input and no search is
+    needed. Plans depend only on the two lengths and are cached; the returned
+    arrays are read-only.
+    """
+    positions = np.linspace(0, n_points - 1, target_length)
+    idx = np.minimum(positions.astype(np.intp), n_points - 2)
+    weights = (positions - idx).astype(np.float32)
+    idx.flags.writeable = False
+    weights.flags.writeable = False
+    return idx, weights
@@ -8,6 +8,8 @@ Segmentation strategies:
 
 from __future__ import annotations
 
+import numpy as np
+
 from rm_greg.models import NormalizedStroke
 
 
@@ -32,34 +34,31 @@ def segment_glyphs(
     if not strokes:
         return []
 
-    groups: list[list[NormalizedStroke]] = [[strokes[0]]]
-
-    for stroke in strokes[1:]:
-        if not stroke.points:
-            continue
-
-        prev_group = groups[-1]
-        prev_stroke = prev_group[-1]
-
-        if not prev_stroke.points:
-            groups.append([stroke])
-            continue
-
-        # Calculate minimum distance between end of previous stroke
-        # and start of current stroke
-        prev_end = prev_stroke.points[-1]
-        curr_start = stroke.points[0]
-
-        dx = curr_start.x - prev_end.x
-        dy = curr_start.y - prev_end.y
-        distance = (dx**2 + dy**2) ** 0.5
-
-        if distance > gap_threshold:
-            groups.append([stroke])
-        else:
-            prev_group.append(stroke)
-
-    return groups
+    first, rest = strokes[0], [stroke for stroke in strokes[1:] if stroke.points]
+    if not first.points:
+        # An empty leading stroke forms its own group
+        return [[first], *segment_glyphs(rest, gap_threshold)]
+
+    strokes = [first, *rest]
+    n = len(strokes)
+    starts = np.fromiter(
+        (c for stroke in strokes for c in (stroke.points[0].x, stroke.points[0].y)),
+        dtype=np.float64,
+        count=2 * n,
+    ).reshape(n, 2)
+    ends = np.fromiter(
+        (c for stroke in strokes for c in (stroke.points[-1].x, stroke.points[-1].y)),
+        dtype=np.float64,
+        count=2 * n,
+    ).reshape(n, 2)
+
+    # Distance between the end of each stroke and the start of the next;
+    # a new group begins wherever it exceeds the threshold
+    gaps = ends[:-1] - starts[1:]
+    distance = np.hypot(gaps[:, 0], gaps[:, 1])
+    bounds = [0, *(np.flatnonzero(distance > gap_threshold) + 1).tolist(), n]
+
+    return [strokes[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
 
 
 def segment_by_grid(
@@ -81,25 +80,25 @@ def segment_by_grid(
     """
     grid: dict[tuple[int, int], list[NormalizedStroke]] = {}
 
+    strokes = [stroke for stroke in strokes if stroke.points]
+    if not strokes:
+        return grid
+
     row_height = 1.0 / rows
     col_width = 1.0 / cols
 
-    for stroke in strokes:
-        if not stroke.points:
-            continue
-
-        # Use the centroid of the stroke to assign it to a grid cell
-        xs = [p.x for p in stroke.points]
-        ys = [p.y for p in stroke.points]
-        cx = sum(xs) / len(xs)
-        cy = sum(ys) / len(ys)
+    # Use the centroid of each stroke to assign it to a grid cell
+    arrays = [stroke.array for stroke in strokes]
+    xy = np.concatenate([a[:, :2] for a in arrays])
+    counts = np.array([a.shape[0] for a in arrays])
+    starts = np.zeros_like(counts)
+    np.cumsum(counts[:-1], out=starts[1:])
+    centroids = np.add.reduceat(xy, starts, axis=0) / counts[:, None]
 
-        row = min(int(cy / row_height), rows - 1)
-        col = min(int(cx / col_width), cols - 1)
+    cell_rows = np.minimum((centroids[:, 1] / row_height).astype(np.intp), rows - 1)
+    cell_cols = np.minimum((centroids[:, 0] / col_width).astype(np.intp), cols - 1)
 
-        key = (row, col)
-        if key not in grid:
-            grid[key] = []
-        grid[key].append(stroke)
+    for stroke, key in zip(strokes, zip(cell_rows.tolist(), cell_cols.tolist())):
+        grid.setdefault(key, []).append(stroke)
 
     return grid
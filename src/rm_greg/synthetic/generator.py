@@ -9,11 +9,14 @@ can be varied to simulate natural handwriting variation.
 from __future__ import annotations
 
 import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
 
-from rm_greg.models import GreggPrimitive, NormalizedPoint, NormalizedStroke
+from rm_greg._jit import njit, prange
+from rm_greg.models import GreggPrimitive, NormalizedStroke
 from rm_greg.training.dataset import StrokeDataset
 
 
@@ -33,19 +36,27 @@ class SyntheticGenerator:
     with controllable variation in size, position, angle, and noise.
     """
 
-    def __init__(self, seed: int = 42) -> None:
+    def __init__(self, seed: int | np.random.Generator = 42) -> None:
         self.rng = np.random.default_rng(seed)
 
     def generate_dataset(
         self,
         primitives: list[GreggPrimitive] | None = None,
         samples_per_class: int = 100,
+        max_workers: int | None = 1,
     ) -> StrokeDataset:
         """Generate a full dataset of synthetic strokes.
 
+        Classes are independent, so they can be generated in parallel worker
+        processes. Each class draws from its own child of this generator's
+        RNG, so the output for a seed does not depend on ``max_workers``.
+
         Args:
             primitives: Which primitives to generate. Defaults to all.
             samples_per_class: Number of samples per primitive class.
+            max_workers: Maximum number of worker processes. The default of 1
+                generates in this process, where the Numba kernels already use
+                every core; ``None`` uses one worker per CPU.
 
         Returns:
             StrokeDataset with labeled synthetic strokes.
@@ -53,205 +64,256 @@ class SyntheticGenerator:
         if primitives is None:
             primitives = list(GreggPrimitive)
 
+        rngs = self.rng.spawn(len(primitives))
+        n_samples = [samples_per_class] * len(primitives)
+
+        if max_workers == 1 or len(primitives) <= 1:
+            batches = list(map(_generate_class, rngs, primitives, n_samples))
+        else:
+            # Spawn rather than fork: forking after the parallel Numba kernels
+            # have started their thread pool can hang the workers
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+                batches = list(executor.map(_generate_class, rngs, primitives, n_samples))
+
         dataset = StrokeDataset()
 
-        for primitive in primitives:
-            for _ in range(samples_per_class):
-                stroke = self._generate_primitive(primitive)
+        for primitive, strokes in zip(primitives, batches, strict=True):
+            for stroke in strokes:
                 dataset.add_sample(stroke, primitive.value)
 
         return dataset
 
-    def _generate_primitive(self, primitive: GreggPrimitive) -> NormalizedStroke:
-        """Generate a single synthetic stroke for a primitive."""
+    def _generate_batch(self, primitive: GreggPrimitive, n_samples: int) -> list[NormalizedStroke]:
+        """Generate ``n_samples`` synthetic strokes for a primitive."""
+        if n_samples <= 0:
+            return []
+
         generators = {
-            GreggPrimitive.A: self._gen_small_circle,
-            GreggPrimitive.E: self._gen_small_circle,
-            GreggPrimitive.O: self._gen_large_circle,
-            GreggPrimitive.T: lambda: self._gen_line(length=0.05),
-            GreggPrimitive.D: lambda: self._gen_line(length=0.10),
-            GreggPrimitive.N: lambda: self._gen_curve(length=0.05, curvature=0.3),
-            GreggPrimitive.M: lambda: self._gen_curve(length=0.10, curvature=0.3),
-            GreggPrimitive.R: lambda: self._gen_curve(length=0.05, curvature=0.6),
-            GreggPrimitive.L: lambda: self._gen_curve(length=0.10, curvature=0.6),
-            GreggPrimitive.K: lambda: self._gen_curve(length=0.05, curvature=-0.6),
-            GreggPrimitive.G: lambda: self._gen_curve(length=0.10, curvature=-0.6),
-            GreggPrimitive.S: self._gen_s_curve,
-            GreggPrimitive.P: lambda: self._gen_line(length=0.05, angle=-0.5),
-            GreggPrimitive.B: lambda: self._gen_line(length=0.10, angle=-0.5),
-            GreggPrimitive.F: lambda: self._gen_curve(length=0.05, curvature=0.4),
-            GreggPrimitive.V: lambda: self._gen_curve(length=0.10, curvature=0.4),
+            GreggPrimitive.A: self._gen_small_circles,
+            GreggPrimitive.E: self._gen_small_circles,
+            GreggPrimitive.O: self._gen_large_circles,
+            GreggPrimitive.T: lambda n: self._gen_lines(n, length=0.05),
+            GreggPrimitive.D: lambda n: self._gen_lines(n, length=0.10),
+            GreggPrimitive.N: lambda n: self._gen_curves(n, length=0.05, curvature=0.3),
+            GreggPrimitive.M: lambda n: self._gen_curves(n, length=0.10, curvature=0.3),
+            GreggPrimitive.R: lambda n: self._gen_curves(n, length=0.05, curvature=0.6),
+            GreggPrimitive.L: lambda n: self._gen_curves(n, length=0.10, curvature=0.6),
+            GreggPrimitive.K: lambda n: self._gen_curves(n, length=0.05, curvature=-0.6),
+            GreggPrimitive.G: lambda n: self._gen_curves(n, length=0.10, curvature=-0.6),
+            GreggPrimitive.S: self._gen_s_curves,
+            GreggPrimitive.P: lambda n: self._gen_lines(n, length=0.05, angle=-0.5),
+            GreggPrimitive.B: lambda n: self._gen_lines(n, length=0.10, angle=-0.5),
+            GreggPrimitive.F: lambda n: self._gen_curves(n, length=0.05, curvature=0.4),
+            GreggPrimitive.V: lambda n: self._gen_curves(n, length=0.10, curvature=0.4),
         }
 
-        gen_fn = generators.get(primitive, self._gen_small_circle)
-        return gen_fn()
+        gen_fn = generators.get(primitive, self._gen_small_circles)
+        return gen_fn(n_samples)
 
-    def _gen_small_circle(self) -> NormalizedStroke:
-        """Generate a small circle (vowels a, e)."""
-        return self._gen_circle(radius=0.015)
+    def _gen_small_circles(self, n_samples: int) -> list[NormalizedStroke]:
+        """Generate small circles (vowels a, e)."""
+        return self._gen_circles(n_samples, radius=0.015)
 
-    def _gen_large_circle(self) -> NormalizedStroke:
-        """Generate a large circle (vowel o)."""
-        return self._gen_circle(radius=0.03)
+    def _gen_large_circles(self, n_samples: int) -> list[NormalizedStroke]:
+        """Generate large circles (vowel o)."""
+        return self._gen_circles(n_samples, radius=0.03)
 
-    def _gen_circle(self, radius: float = 0.02) -> NormalizedStroke:
-        """Generate a circle with controlled variation."""
+    def _gen_circles(self, n_samples: int, radius: float = 0.02) -> list[NormalizedStroke]:
+        """Generate circles with controlled variation."""
         # Add variation
-        radius *= 1.0 + self.rng.normal(0, 0.15)
-        center_x = self.rng.uniform(0.2, 0.8)
-        center_y = self.rng.uniform(0.2, 0.8)
-        n_points = self.rng.integers(20, 40)
-
-        angles = np.linspace(0, 2 * math.pi, n_points)
+        radii = radius * (1.0 + self.rng.normal(0, 0.15, n_samples))
+        center_x = self.rng.uniform(0.2, 0.8, n_samples)
+        center_y = self.rng.uniform(0.2, 0.8, n_samples)
+        n_points = self.rng.integers(20, 40, n_samples)
         # Add slight eccentricity
-        eccentricity = 1.0 + self.rng.normal(0, 0.1)
-
-        points = []
-        for i, angle in enumerate(angles):
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * eccentricity * math.sin(angle)
-
-            # Add jitter
-            x += self.rng.normal(0, radius * 0.05)
-            y += self.rng.normal(0, radius * 0.05)
-
-            # Clamp to [0, 1]
-            x = max(0.0, min(1.0, x))
-            y = max(0.0, min(1.0, y))
-
-            pressure = max(0.0, min(1.0, 0.5 + self.rng.normal(0, 0.1)))
-            speed = max(0.0, abs(self.rng.normal(0.5, 0.15)))
-
-            points.append(
-                NormalizedPoint(
-                    x=x,
-                    y=y,
-                    pressure=pressure,
-                    speed=speed,
-                    timestamp=float(i) / n_points,
-                )
-            )
-
-        return NormalizedStroke(points=points)
-
-    def _gen_line(
-        self, length: float = 0.08, angle: float = 0.0
-    ) -> NormalizedStroke:
-        """Generate a straight line with variation."""
-        length *= 1.0 + self.rng.normal(0, 0.15)
-        angle += self.rng.normal(0, 0.1)
-
-        start_x = self.rng.uniform(0.2, 0.6)
-        start_y = self.rng.uniform(0.3, 0.7)
-        n_points = self.rng.integers(15, 30)
-
-        points = []
-        for i in range(n_points):
-            t = i / (n_points - 1)
-            x = start_x + t * length * math.cos(angle)
-            y = start_y + t * length * math.sin(angle)
-
-            # Add jitter (less than circles)
-            x += self.rng.normal(0, length * 0.02)
-            y += self.rng.normal(0, length * 0.02)
-
-            x = max(0.0, min(1.0, x))
-            y = max(0.0, min(1.0, y))
-
-            pressure = max(0.0, min(1.0, 0.5 + self.rng.normal(0, 0.1)))
-            speed = max(0.0, abs(self.rng.normal(0.6, 0.1)))
-
-            points.append(
-                NormalizedPoint(
-                    x=x,
-                    y=y,
-                    pressure=pressure,
-                    speed=speed,
-                    timestamp=t,
-                )
-            )
-
-        return NormalizedStroke(points=points)
-
-    def _gen_curve(
+        eccentricity = 1.0 + self.rng.normal(0, 0.1, n_samples)
+        noise = self.rng.standard_normal((n_samples, n_points.max(), 2), dtype=np.float32)
+
+        xy = _batch_circles(n_points, center_x, center_y, radii, eccentricity, noise)
+        return self._make_strokes(
+            xy,
+            n_points,
+            speed_mean=0.5,
+            speed_std=0.15,
+            closed=True,
+        )
+
+    def _gen_lines(
+        self, n_samples: int, length: float = 0.08, angle: float = 0.0
+    ) -> list[NormalizedStroke]:
+        """Generate straight lines with variation."""
+        lengths = length * (1.0 + self.rng.normal(0, 0.15, n_samples))
+        angles = angle + self.rng.normal(0, 0.1, n_samples)
+        start_x = self.rng.uniform(0.2, 0.6, n_samples)
+        start_y = self.rng.uniform(0.3, 0.7, n_samples)
+        n_points = self.rng.integers(15, 30, n_samples)
+        noise = self.rng.standard_normal((n_samples, n_points.max(), 2), dtype=np.float32)
+
+        # Jitter is less than for circles
+        xy = _batch_curves(
+            n_points, start_x, start_y, lengths, angles, np.zeros(n_samples), 1.0, 0.02, noise
+        )
+        return self._make_strokes(xy, n_points, speed_mean=0.6, speed_std=0.1)
+
+    def _gen_curves(
         self,
+        n_samples: int,
         length: float = 0.08,
         curvature: float = 0.5,
-    ) -> NormalizedStroke:
-        """Generate a curved stroke (arcs for r, l, k, g, n, m, etc.)."""
-        length *= 1.0 + self.rng.normal(0, 0.15)
-        curvature *= 1.0 + self.rng.normal(0, 0.2)
-
-        start_x = self.rng.uniform(0.2, 0.6)
-        start_y = self.rng.uniform(0.3, 0.7)
-        base_angle = self.rng.normal(0, 0.15)
-        n_points = self.rng.integers(20, 40)
-
-        points = []
-        for i in range(n_points):
-            t = i / (n_points - 1)
-            # Parametric curve: line + sinusoidal deviation
-            x = start_x + t * length * math.cos(base_angle)
-            y = start_y + t * length * math.sin(base_angle)
-
-            # Add curvature (perpendicular displacement)
-            perp_x = -math.sin(base_angle)
-            perp_y = math.cos(base_angle)
-            curve_amount = curvature * length * math.sin(math.pi * t)
-            x += perp_x * curve_amount
-            y += perp_y * curve_amount
-
-            # Add jitter
-            x += self.rng.normal(0, length * 0.02)
-            y += self.rng.normal(0, length * 0.02)
-
-            x = max(0.0, min(1.0, x))
-            y = max(0.0, min(1.0, y))
-
-            pressure = max(0.0, min(1.0, 0.5 + self.rng.normal(0, 0.1)))
-            speed = max(0.0, abs(self.rng.normal(0.5, 0.15)))
-
-            points.append(
-                NormalizedPoint(
-                    x=x,
-                    y=y,
-                    pressure=pressure,
-                    speed=speed,
-                    timestamp=t,
-                )
-            )
-
-        return NormalizedStroke(points=points)
-
-    def _gen_s_curve(self) -> NormalizedStroke:
-        """Generate an S-shaped curve (for 's' primitive)."""
-        length = 0.04 * (1.0 + self.rng.normal(0, 0.15))
-        start_x = self.rng.uniform(0.3, 0.7)
-        start_y = self.rng.uniform(0.3, 0.7)
-        n_points = self.rng.integers(20, 35)
-
-        points = []
-        for i in range(n_points):
-            t = i / (n_points - 1)
-            x = start_x + t * length
-            # S-curve: two half-sine waves
-            y = start_y + length * 0.3 * math.sin(2 * math.pi * t)
-
-            x += self.rng.normal(0, length * 0.03)
-            y += self.rng.normal(0, length * 0.03)
-
-            x = max(0.0, min(1.0, x))
-            y = max(0.0, min(1.0, y))
-
-            pressure = max(0.0, min(1.0, 0.5 + self.rng.normal(0, 0.1)))
-
-            points.append(
-                NormalizedPoint(
-                    x=x,
-                    y=y,
-                    pressure=pressure,
-                    timestamp=t,
-                )
-            )
-
-        return NormalizedStroke(points=points)
+    ) -> list[NormalizedStroke]:
+        """Generate curved strokes (arcs for r, l, k, g, n, m, etc.)."""
+        lengths = length * (1.0 + self.rng.normal(0, 0.15, n_samples))
+        curvatures = curvature * (1.0 + self.rng.normal(0, 0.2, n_samples))
+        start_x = self.rng.uniform(0.2, 0.6, n_samples)
+        start_y = self.rng.uniform(0.3, 0.7, n_samples)
+        base_angles = self.rng.normal(0, 0.15, n_samples)
+        n_points = self.rng.integers(20, 40, n_samples)
+        noise = self.rng.standard_normal((n_samples, n_points.max(), 2), dtype=np.float32)
+
+        xy = _batch_curves(
+            n_points, start_x, start_y, lengths, base_angles, curvatures, 1.0, 0.02, noise
+        )
+        return self._make_strokes(xy, n_points, speed_mean=0.5, speed_std=0.15)
+
+    def _gen_s_curves(self, n_samples: int) -> list[NormalizedStroke]:
+        """Generate S-shaped curves (for 's' primitive)."""
+        lengths = 0.04 * (1.0 + self.rng.normal(0, 0.15, n_samples))
+        start_x = self.rng.uniform(0.3, 0.7, n_samples)
+        start_y = self.rng.uniform(0.3, 0.7, n_samples)
+        n_points = self.rng.integers(20, 35, n_samples)
+        noise = self.rng.standard_normal((n_samples, n_points.max(), 2), dtype=np.float32)
+
+        # S-curve: two half-sine waves along a horizontal baseline
+        xy = _batch_curves(
+            n_points,
+            start_x,
+            start_y,
+            lengths,
+            np.zeros(n_samples),
+            np.full(n_samples, 0.3),
+            2.0,
+            0.03,
+            noise,
+        )
+        return self._make_strokes(xy, n_points, speed_mean=0.0, speed_std=0.0)
+
+    def _make_strokes(
+        self,
+        xy: np.ndarray,
+        n_points: np.ndarray,
+        speed_mean: float,
+        speed_std: float,
+        closed: bool = False,
+    ) -> list[NormalizedStroke]:
+        """Draw pressure and speed noise and build strokes from a padded batch.
+
+        Args:
+            xy: Array of shape (n_samples, max_points, 2), already clamped to
+                [0, 1]. Sample ``s`` uses its first ``n_points[s]`` rows.
+            n_points: Number of points in each sample.
+            speed_mean: Mean of the per-point speed noise.
+            speed_std: Standard deviation of the per-point speed noise.
+            closed: Whether the shape is closed. Closed shapes use timestamps
+                ``i / n`` and open ones ``i / (n - 1)``.
+
+        Returns:
+            One NormalizedStroke per sample.
+        """
+        n_samples, max_points = xy.shape[:2]
+        shape = (n_samples, max_points)
+        columns = np.zeros((n_samples, max_points, 6), dtype=np.float32)
+        columns[..., :2] = xy
+
+        pressure = self.rng.standard_normal(shape, dtype=np.float32)
+        pressure *= 0.1
+        pressure += 0.5
+        np.clip(pressure, 0.0, 1.0, out=columns[..., 2])
+
+        speed = self.rng.standard_normal(shape, dtype=np.float32)
+        speed *= speed_std
+        speed += speed_mean
+        np.abs(speed, out=columns[..., 4])
+
+        strokes = []
+        for s, n in enumerate(n_points.tolist()):
+            timestamps = np.arange(n, dtype=np.float32) / np.float32(n if closed else n - 1)
+            strokes.append(NormalizedStroke.from_array(columns[s, :n], timestamps=timestamps))
+        return strokes
+
+
+def _generate_class(
+    rng: np.random.Generator, primitive: GreggPrimitive, n_samples: int
+) -> list[NormalizedStroke]:
+    """Generate one class's strokes; a module-level function so workers can run it."""
+    return SyntheticGenerator(rng)._generate_batch(primitive, n_samples)
+
+
+@njit(cache=True, parallel=True)
+def _batch_circles(
+    n_points: np.ndarray,
+    center_x: np.ndarray,
+    center_y: np.ndarray,
+    radius: np.ndarray,
+    eccentricity: np.ndarray,
+    noise: np.ndarray,
+) -> np.ndarray:
+    """Fill a padded float32 (n_samples, max_points, 2) batch of jittered ellipses.
+
+    ``noise`` holds pre-drawn standard normal samples of the same shape, so
+    the kernel itself is deterministic and free of RNG state.
+    """
+    n_samples, max_points = noise.shape[0], noise.shape[1]
+    xy = np.zeros((n_samples, max_points, 2), dtype=np.float32)
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    for s in prange(n_samples):
+        n = n_points[s]
+        angles = np.linspace(0.0, 2.0 * math.pi, n).astype(np.float32)
+        r = np.float32(radius[s])
+        r_y = np.float32(radius[s] * eccentricity[s])
+        jitter = np.float32(radius[s] * 0.05)
+        x = np.float32(center_x[s]) + r * np.cos(angles) + jitter * noise[s, :n, 0]
+        y = np.float32(center_y[s]) + r_y * np.sin(angles) + jitter * noise[s, :n, 1]
+        xy[s, :n, 0] = np.minimum(np.maximum(x, zero), one)
+        xy[s, :n, 1] = np.minimum(np.maximum(y, zero), one)
+    return xy
+
+
+@njit(cache=True, parallel=True)
+def _batch_curves(
+    n_points: np.ndarray,
+    start_x: np.ndarray,
+    start_y: np.ndarray,
+    length: np.ndarray,
+    angle: np.ndarray,
+    amplitude: np.ndarray,
+    frequency: float,
+    jitter: float,
+    noise: np.ndarray,
+) -> np.ndarray:
+    """Fill a padded float32 (n_samples, max_points, 2) batch of jittered open strokes.
+
+    Each stroke runs ``length`` along ``angle`` from its start point and is
+    displaced perpendicular to that direction by
+    ``amplitude * length * sin(frequency * pi * t)``. A zero amplitude gives a
+    straight line. Jitter is ``jitter * length`` times the pre-drawn ``noise``.
+    """
+    n_samples, max_points = noise.shape[0], noise.shape[1]
+    xy = np.zeros((n_samples, max_points, 2), dtype=np.float32)
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    omega = np.float32(frequency * math.pi)
+    for s in prange(n_samples):
+        n = n_points[s]
+        t = np.arange(n).astype(np.float32) / np.float32(n - 1)
+        cos_a = np.float32(math.cos(angle[s]))
+        sin_a = np.float32(math.sin(angle[s]))
+        along = np.float32(length[s]) * t
+        across = np.float32(amplitude[s] * length[s]) * np.sin(omega * t)
+        scale = np.float32(jitter * length[s])
+        x = np.float32(start_x[s]) + along * cos_a - across * sin_a + scale * noise[s, :n, 0]
+        y = np.float32(start_y[s]) + along * sin_a + across * cos_a + scale * noise[s, :n, 1]
+        xy[s, :n, 0] = np.minimum(np.maximum(x, zero), one)
+        xy[s, :n, 1] = np.minimum(np.maximum(y, zero), one)
+    return xy
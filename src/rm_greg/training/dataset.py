@@ -7,13 +7,32 @@ classical ML and neural network training.
 from __future__ import annotations
 
 import json
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
 
 import numpy as np
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from rm_greg.models import GreggPrimitive, NormalizedPoint, NormalizedStroke
-from rm_greg.preprocessing.features import GeometricFeatures, extract_geometric_features
-from rm_greg.preprocessing.normalize import interpolate_stroke, stroke_to_array
+from rm_greg.preprocessing.features import N_FEATURES, extract_geometric_features_batch
+from rm_greg.preprocessing.normalize import (
+    NORMALIZED_COLUMNS,
+    interpolate_stroke,
+    strokes_to_array,
+)
+
+# Leading bytes of a zip archive, which is what np.savez writes
+_NPZ_MAGIC = b"PK\x03\x04"
+
+# Point attributes packed into NPZ files, in column order
+_POINT_GETTER = attrgetter(*NORMALIZED_COLUMNS)
 
 
 class StrokeDataset:
@@ -26,6 +45,7 @@ class StrokeDataset:
     def __init__(self) -> None:
         self.strokes: list[NormalizedStroke] = []
         self.labels: list[str] = []
+        self._reset_feature_cache()
 
     def add_sample(self, stroke: NormalizedStroke, label: str) -> None:
         """Add a labeled stroke to the dataset."""
@@ -38,21 +58,47 @@ class StrokeDataset:
     def get_feature_matrix(self) -> tuple[np.ndarray, np.ndarray]:
         """Extract geometric features for all strokes.
 
+        Features are cached: each call only extracts the strokes added since
+        the previous one, so strokes must not be modified once added. The
+        returned feature matrix is a read-only view of the cache.
+
         Returns:
             Tuple of (X, y) where X is (n_samples, n_features) and
             y is (n_samples,) of string labels.
         """
-        features = []
-        valid_labels = []
-
-        for stroke, label in zip(self.strokes, self.labels):
-            if len(stroke.points) < 2:
-                continue
-            feat = extract_geometric_features(stroke)
-            features.append(feat.to_array())
-            valid_labels.append(label)
-
-        return np.stack(features), np.array(valid_labels)
+        self._update_feature_cache()
+        features = self._features[: len(self._valid)]
+        features.flags.writeable = False
+        return features, np.array([self.labels[i] for i in self._valid])
+
+    def _reset_feature_cache(self) -> None:
+        # Rows of _features hold the features of strokes _valid[0], _valid[1], ...
+        # among the first _n_featurized entries of the _featurized list
+        self._featurized: list[NormalizedStroke] = self.strokes
+        self._n_featurized = 0
+        self._valid: list[int] = []
+        self._features = np.empty((0, N_FEATURES), dtype=np.float32)
+
+    def _update_feature_cache(self) -> None:
+        if self._featurized is not self.strokes or self._n_featurized > len(self.strokes):
+            self._reset_feature_cache()
+
+        start = self._n_featurized
+        new_valid = [i for i in range(start, len(self.strokes)) if len(self.strokes[i].points) >= 2]
+        self._n_featurized = len(self.strokes)
+        if not new_valid:
+            return
+
+        rows = extract_geometric_features_batch([self.strokes[i] for i in new_valid])
+        n_old = len(self._valid)
+        n_new = n_old + len(rows)
+        if n_new > len(self._features):
+            # Grow geometrically so repeated small additions stay amortized O(1)
+            grown = np.empty((max(n_new, 2 * len(self._features)), N_FEATURES), dtype=np.float32)
+            grown[:n_old] = self._features[:n_old]
+            self._features = grown
+        self._features[n_old:n_new] = rows
+        self._valid.extend(new_valid)
 
     def get_sequence_arrays(
         self, target_length: int = 64
@@ -66,21 +112,33 @@ class StrokeDataset:
             Tuple of (X, y) where X is (n_samples, target_length, n_features)
             and y is (n_samples,) of string labels.
         """
-        sequences = []
-        valid_labels = []
+        valid = [i for i, stroke in enumerate(self.strokes) if len(stroke.points) >= 2]
+
+        # Strokes with the same length share an interpolation plan, so resample
+        # each length bucket as one stacked array
+        buckets: dict[int, list[int]] = defaultdict(list)
+        for row, i in enumerate(valid):
+            buckets[len(self.strokes[i].points)].append(row)
 
-        for stroke, label in zip(self.strokes, self.labels):
-            if len(stroke.points) < 2:
-                continue
-            arr = stroke_to_array(stroke)
-            interp = interpolate_stroke(arr, target_length)
-            sequences.append(interp)
-            valid_labels.append(label)
+        sequences = np.empty((len(valid), target_length, 6), dtype=np.float32)
+        for rows in buckets.values():
+            stacked = strokes_to_array([self.strokes[valid[row]] for row in rows])
+            sequences[rows] = interpolate_stroke(stacked, target_length)
 
-        return np.stack(sequences), np.array(valid_labels)
+        return sequences, np.array([self.labels[i] for i in valid])
 
     def save(self, path: Path) -> None:
-        """Save dataset to JSON."""
+        """Save dataset to disk.
+
+        A ``.npz`` path stores all points as one packed array with stroke
+        offsets and labels; any other path stores JSON, encoded with orjson
+        when it is installed (``pip install rm-gregg[fast]``).
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".npz":
+            self._save_npz(path)
+            return
+
         data = {
             "samples": [
                 {
@@ -90,15 +148,25 @@ class StrokeDataset:
                 for stroke, label in zip(self.strokes, self.labels)
             ]
         }
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if HAS_ORJSON:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
         with open(path, "w") as f:
             json.dump(data, f, indent=2)
 
     @classmethod
     def load(cls, path: Path) -> StrokeDataset:
-        """Load dataset from JSON."""
-        with open(path) as f:
-            data = json.load(f)
+        """Load dataset from an NPZ or JSON file written by ``save``."""
+        with open(path, "rb") as f:
+            magic = f.read(len(_NPZ_MAGIC))
+        if magic == _NPZ_MAGIC:
+            return cls._load_npz(path)
+
+        if HAS_ORJSON:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path) as f:
+                data = json.load(f)
 
         dataset = cls()
         for sample in data["samples"]:
@@ -107,3 +175,31 @@ class StrokeDataset:
             dataset.add_sample(stroke, sample["label"])
 
         return dataset
+
+    def _save_npz(self, path: Path) -> None:
+        offsets = np.zeros(len(self.strokes) + 1, dtype=np.int64)
+        np.cumsum([len(stroke.points) for stroke in self.strokes], out=offsets[1:])
+        points = np.fromiter(
+            (v for stroke in self.strokes for p in stroke.points for v in _POINT_GETTER(p)),
+            dtype=np.float64,
+            count=int(offsets[-1]) * len(NORMALIZED_COLUMNS),
+        ).reshape(-1, len(NORMALIZED_COLUMNS))
+        np.savez_compressed(
+            path, points=points, offsets=offsets, labels=np.array(self.labels, dtype=str)
+        )
+
+    @classmethod
+    def _load_npz(cls, path: Path) -> StrokeDataset:
+        with np.load(path, allow_pickle=False) as data:
+            points = data["points"]
+            offsets = data["offsets"].tolist()
+            labels = data["labels"].tolist()
+
+        dataset = cls()
+        for start, end, label in zip(offsets[:-1], offsets[1:], labels):
+            stroke = NormalizedStroke.from_array(
+                points[start:end, :6], timestamps=points[start:end, 6], label=label
+            )
+            dataset.add_sample(stroke, label)
+
+        return dataset
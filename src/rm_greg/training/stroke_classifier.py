@@ -17,7 +17,7 @@ from typing import Any
 import numpy as np
 
 from rm_greg.models import NormalizedStroke
-from rm_greg.preprocessing.features import extract_geometric_features
+from rm_greg.preprocessing.features import extract_geometric_features_batch
 from rm_greg.training.dataset import StrokeDataset
 
 
@@ -37,6 +37,7 @@ class StrokeClassifier:
         self.model_type = model_type
         self.model: Any = None
         self.label_encoder: Any = None
+        self._labels: list[str] = []
         self._build_model()
 
     def _build_model(self) -> None:
@@ -81,6 +82,7 @@ class StrokeClassifier:
 
         X, y_str = dataset.get_feature_matrix()
         y = self.label_encoder.fit_transform(y_str)
+        self._labels = self.label_encoder.classes_.tolist()
 
         # Cross-validation score
         scores = cross_val_score(self.model, X, y, cv=min(5, len(set(y))), scoring="accuracy")
@@ -104,10 +106,7 @@ class StrokeClassifier:
         Returns:
             Predicted label string.
         """
-        features = extract_geometric_features(stroke)
-        X = features.to_array().reshape(1, -1)
-        y_pred = self.model.predict(X)
-        return str(self.label_encoder.inverse_transform(y_pred)[0])
+        return self.predict_batch([stroke])[0]
 
     def predict_proba(self, stroke: NormalizedStroke) -> dict[str, float]:
         """Predict class probabilities for a stroke.
@@ -118,11 +117,35 @@ class StrokeClassifier:
         Returns:
             Dictionary mapping label names to probabilities.
         """
-        features = extract_geometric_features(stroke)
-        X = features.to_array().reshape(1, -1)
-        probs = self.model.predict_proba(X)[0]
-        labels = self.label_encoder.inverse_transform(range(len(probs)))
-        return dict(zip(labels, probs.tolist()))
+        return self.predict_proba_batch([stroke])[0]
+
+    def predict_batch(self, strokes: list[NormalizedStroke]) -> list[str]:
+        """Predict labels for many strokes with a single model call.
+
+        Args:
+            strokes: Normalized strokes to classify.
+
+        Returns:
+            Predicted label strings, in input order.
+        """
+        if not strokes:
+            return []
+        y_pred = self.model.predict(extract_geometric_features_batch(strokes))
+        return [self._labels[i] for i in y_pred.tolist()]
+
+    def predict_proba_batch(self, strokes: list[NormalizedStroke]) -> list[dict[str, float]]:
+        """Predict class probabilities for many strokes with a single model call.
+
+        Args:
+            strokes: Normalized strokes to classify.
+
+        Returns:
+            One dictionary per stroke mapping label names to probabilities.
+        """
+        if not strokes:
+            return []
+        probs = self.model.predict_proba(extract_geometric_features_batch(strokes))
+        return [dict(zip(self._labels, row)) for row in probs.tolist()]
 
     def save(self, path: Path) -> None:
         """Save the trained model to disk."""
@@ -147,4 +170,5 @@ class StrokeClassifier:
         classifier.model_type = data["model_type"]
         classifier.model = data["model"]
         classifier.label_encoder = data["label_encoder"]
+        classifier._labels = classifier.label_encoder.classes_.tolist()
         return classifier
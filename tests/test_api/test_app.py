@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
 
 try:
@@ -39,3 +42,62 @@ class TestCurriculumEndpoint:
     def test_unknown_unit_returns_404(self, client: TestClient) -> None:
         response = client.get("/api/v1/curriculum/99")
         assert response.status_code == 404
+
+
+class TestClassifyEndpoint:
+    @pytest.fixture
+    def model_client(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+        pytest.importorskip("sklearn")
+        from rm_greg.models import GreggPrimitive
+        from rm_greg.synthetic.generator import SyntheticGenerator
+        from rm_greg.training.stroke_classifier import StrokeClassifier
+
+        dataset = SyntheticGenerator(seed=0).generate_dataset(
+            primitives=[GreggPrimitive.A, GreggPrimitive.T], samples_per_class=10
+        )
+        classifier = StrokeClassifier("rf")
+        classifier.train(dataset)
+        model_path = tmp_path / "model.pkl"
+        classifier.save(model_path)
+
+        monkeypatch.setenv("RM_GREGG_MODEL", str(model_path))
+        with TestClient(app) as c:
+            yield c
+
+    def test_without_model_returns_501(self, client: TestClient) -> None:
+        response = client.post("/api/v1/classify", json={"points": [{"x": 0.1, "y": 0.1}]})
+        assert response.status_code == 501
+
+    def test_classifies_stroke(self, model_client: TestClient) -> None:
+        points = [{"x": 0.1 + 0.01 * i, "y": 0.5} for i in range(20)]
+        response = model_client.post("/api/v1/classify", json={"points": points})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["predicted_label"] in ("a", "t")
+        assert data["confidence"] == max(data["probabilities"].values())
+
+    def test_invalid_point_returns_422(self, model_client: TestClient) -> None:
+        points = [{"x": 2.0, "y": 0.5}, {"x": 0.1, "y": 0.5}]
+        response = model_client.post("/api/v1/classify", json={"points": points})
+        assert response.status_code == 422
+
+    def test_shutdown_clears_batcher(self, model_client: TestClient) -> None:
+        model_client.__exit__(None, None, None)
+        assert app.state.classify_batcher is None
+
+
+class TestUploadEndpoint:
+    def test_rejects_non_rm_file(self, client: TestClient) -> None:
+        response = client.post("/api/v1/upload", files={"file": ("notes.txt", b"data")})
+        assert response.status_code == 400
+
+    def test_streams_upload_to_disk(self, client: TestClient) -> None:
+        content = bytes(range(256)) * 10_000  # Larger than one chunk
+        response = client.post("/api/v1/upload", files={"file": ("page.rm", content)})
+        assert response.status_code == 200
+
+        saved = Path(response.json()["path"])
+        try:
+            assert saved.read_bytes() == content
+        finally:
+            saved.unlink()
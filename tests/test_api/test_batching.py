@@ -0,0 +1,86 @@
+"""Tests for API micro-batching."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from rm_greg.api.batching import MicroBatcher
+
+
+def _run_batched(
+    batch_fn: object, items: list[int], max_batch: int = 32
+) -> tuple[list[object], list[list[int]]]:
+    calls: list[list[int]] = []
+
+    def recording_fn(batch: list[int]) -> list[object]:
+        calls.append(list(batch))
+        return batch_fn(batch)  # type: ignore[operator]
+
+    async def main() -> list[object]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = MicroBatcher(recording_fn, executor, max_batch=max_batch, max_latency=0.05)
+            batcher.start()
+            try:
+                return await asyncio.gather(
+                    *(batcher.submit(i) for i in items), return_exceptions=True
+                )
+            finally:
+                await batcher.stop()
+
+    return asyncio.run(main()), calls
+
+
+class TestMicroBatcher:
+    def test_results_match_submissions(self) -> None:
+        results, _ = _run_batched(lambda batch: [i * 2 for i in batch], list(range(10)))
+        assert results == [i * 2 for i in range(10)]
+
+    def test_concurrent_submissions_are_batched(self) -> None:
+        _, calls = _run_batched(lambda batch: batch, list(range(10)))
+        assert len(calls) < 10
+        assert sorted(i for call in calls for i in call) == list(range(10))
+
+    def test_respects_max_batch(self) -> None:
+        _, calls = _run_batched(lambda batch: batch, list(range(10)), max_batch=3)
+        assert all(len(call) <= 3 for call in calls)
+
+    def test_errors_propagate_to_every_caller(self) -> None:
+        def fail(batch: list[int]) -> list[int]:
+            raise ValueError("boom")
+
+        results, _ = _run_batched(fail, [1, 2])
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_submit_before_start_raises(self) -> None:
+        async def main() -> None:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                await MicroBatcher(lambda b: b, executor).submit(1)
+
+        with pytest.raises(RuntimeError, match="not been started"):
+            asyncio.run(main())
+
+    def test_stop_cancels_in_flight_batch(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(batch: list[int]) -> list[int]:
+            started.set()
+            release.wait(5)
+            return batch
+
+        async def main() -> bool:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                batcher = MicroBatcher(slow, executor, max_latency=0.0)
+                batcher.start()
+                task = asyncio.ensure_future(batcher.submit(1))
+                await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+                await batcher.stop()
+                release.set()
+                await asyncio.wait([task], timeout=1)
+                return task.cancelled()
+
+        assert asyncio.run(main())
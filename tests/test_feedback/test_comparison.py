@@ -2,25 +2,35 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from rm_greg.models import NormalizedPoint, NormalizedStroke
-from rm_greg.feedback.comparison import compare_strokes, StrokeComparison
+from rm_greg.feedback.comparison import (
+    _cached_profile,
+    _compute_dtw,
+    _compute_dtw_frechet,
+    _compute_frechet,
+    _dtw_batch_kernel,
+    _run_dtw_frechet,
+    _simple_dtw,
+    _total_curvature,
+    batch_total_curvature,
+    compare_strokes,
+    compare_strokes_batch,
+    profile_points,
+    profile_stroke,
+    StrokeComparison,
+)
+from rm_greg.feedback.scoring import score_attempt
 
 
 def _make_line(
     x_start: float, y_start: float, x_end: float, y_end: float, n: int = 10
 ) -> NormalizedStroke:
-    points = []
-    for i in range(n):
-        t = i / (n - 1)
-        points.append(
-            NormalizedPoint(
-                x=x_start + t * (x_end - x_start),
-                y=y_start + t * (y_end - y_start),
-            )
-        )
-    return NormalizedStroke(points=points)
+    xs = np.linspace(x_start, x_end, n).tolist()
+    ys = np.linspace(y_start, y_end, n).tolist()
+    return NormalizedStroke(points=[NormalizedPoint(x=x, y=y) for x, y in zip(xs, ys)])
 
 
 class TestCompareStrokes:
@@ -32,6 +42,20 @@ class TestCompareStrokes:
         assert result.size_ratio == pytest.approx(1.0, abs=0.01)
         assert result.curvature_deviation == pytest.approx(0.0, abs=0.01)
 
+    def test_identical_copies_skip_to_exact_result(self) -> None:
+        stroke = _make_line(0.1, 0.1, 0.5, 0.3)
+        copy = NormalizedStroke(points=list(stroke.points))
+        profile = profile_stroke(stroke)
+
+        assert compare_strokes(copy, stroke) == compare_strokes(stroke, stroke)
+        assert compare_strokes(copy, stroke) == StrokeComparison(
+            *_compute_dtw_frechet(profile.path, profile.path),
+            size_ratio=1.0,
+            curvature_deviation=0.0,
+            angle_deviation=0.0,
+            proportion_error=0.0,
+        )
+
     def test_different_size_strokes(self) -> None:
         small = _make_line(0.4, 0.4, 0.5, 0.5)
         large = _make_line(0.1, 0.1, 0.9, 0.9)
@@ -45,3 +69,177 @@ class TestCompareStrokes:
         result = compare_strokes(s1, s2)
 
         assert 0.0 <= result.overall_similarity <= 1.0
+
+    def test_frechet_handles_long_strokes(self) -> None:
+        # Long enough to exceed the default recursion limit of a recursive solver;
+        # called directly because compare_strokes resamples to RESAMPLE_POINTS
+        t = np.linspace(0.0, 1.0, 1500)
+        a = np.column_stack([0.1 + 0.8 * t, np.full_like(t, 0.1)])
+        b = np.column_stack([0.1 + 0.8 * t, np.full_like(t, 0.2)])
+
+        assert _compute_frechet(a, b) == pytest.approx(0.1, abs=1e-4)
+
+    def test_dtw_is_per_point_deviation(self) -> None:
+        for n in (5, 200):
+            s1 = _make_line(0.1, 0.1, 0.5, 0.1, n=n)
+            s2 = _make_line(0.1, 0.12, 0.5, 0.12, n=n)
+
+            assert compare_strokes(s1, s2).dtw_distance == pytest.approx(0.02, abs=1e-4)
+
+    def test_scores_do_not_depend_on_point_count(self) -> None:
+        scores = [
+            score_attempt(
+                compare_strokes(
+                    _make_line(0.1, 0.1, 0.5, 0.1, n=n), _make_line(0.1, 0.12, 0.5, 0.12, n=n)
+                )
+            )
+            for n in (5, 20, 200)
+        ]
+
+        for score in scores:
+            assert score.shape_score == pytest.approx(0.96, abs=1e-3)
+            assert score.overall_score == pytest.approx(scores[0].overall_score, abs=1e-3)
+
+    def test_distances_ignore_sampling_density(self) -> None:
+        sparse = _make_line(0.1, 0.1, 0.5, 0.5, n=10)
+        dense = _make_line(0.1, 0.1, 0.5, 0.5, n=200)
+        result = compare_strokes(dense, sparse)
+
+        assert result.dtw_distance == pytest.approx(0.0, abs=1e-4)
+        assert result.frechet_distance == pytest.approx(0.0, abs=1e-4)
+
+    def test_window_never_beats_unconstrained(self) -> None:
+        user = _make_line(0.1, 0.1, 0.5, 0.5)
+        reference = _make_line(0.1, 0.5, 0.5, 0.1, n=30)
+        banded = compare_strokes(user, reference, window=2)
+        unconstrained = compare_strokes(user, reference, window=None)
+
+        assert banded.dtw_distance >= unconstrained.dtw_distance - 1e-6
+        assert compare_strokes(user, user, window=2).dtw_distance == pytest.approx(0.0, abs=1e-6)
+
+    def test_reference_profile_is_reused(self) -> None:
+        reference = _make_line(0.1, 0.1, 0.5, 0.5)
+        first = compare_strokes(_make_line(0.1, 0.1, 0.6, 0.6), reference)
+        second = compare_strokes(_make_line(0.1, 0.1, 0.6, 0.6), reference)
+
+        assert _cached_profile(reference) is _cached_profile(reference)
+        assert first == second
+
+    def test_accepts_array_profiles(self) -> None:
+        user = _make_line(0.1, 0.1, 0.6, 0.6)
+        reference = _make_line(0.1, 0.1, 0.5, 0.5)
+        user_xy = np.array([[p.x, p.y] for p in user.points])
+
+        from_models = compare_strokes(user, reference)
+        from_arrays = compare_strokes(profile_points(user_xy), profile_stroke(reference))
+
+        assert from_arrays.dtw_distance == pytest.approx(from_models.dtw_distance)
+        assert from_arrays.size_ratio == pytest.approx(from_models.size_ratio)
+
+
+class TestCompareStrokesBatch:
+    def test_matches_individual_comparisons(self) -> None:
+        reference = _make_line(0.1, 0.1, 0.5, 0.5)
+        attempts = [
+            _make_line(0.1, 0.1, 0.6, 0.6),
+            _make_line(0.2, 0.1, 0.5, 0.4, n=25),
+            _make_line(0.1, 0.5, 0.5, 0.1, n=7),
+            NormalizedStroke(
+                points=[
+                    NormalizedPoint(x=0.5 + 0.2 * np.cos(t), y=0.5 + 0.2 * np.sin(t))
+                    for t in np.linspace(0.0, np.pi, 30)
+                ]
+            ),
+        ]
+
+        batched = compare_strokes_batch(attempts, reference, window=3)
+        for attempt, result in zip(attempts, batched):
+            expected = compare_strokes(attempt, reference, window=3)
+            assert result.dtw_distance == pytest.approx(expected.dtw_distance, rel=1e-5)
+            assert result.frechet_distance == pytest.approx(expected.frechet_distance)
+            assert result.size_ratio == pytest.approx(expected.size_ratio)
+            assert result.curvature_deviation == pytest.approx(
+                expected.curvature_deviation, abs=1e-5
+            )
+
+    def test_empty_batch(self) -> None:
+        assert compare_strokes_batch([], _make_line(0.1, 0.1, 0.5, 0.5)) == []
+
+
+class TestSimpleDTW:
+    def test_accumulates_squared_distances(self) -> None:
+        a = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]])
+        b = np.array([[0.0, 1.0], [1.0, 2.0], [2.0, 1.0]])
+
+        # Diagonal path with squared costs 1, 4, 1
+        assert _simple_dtw(a, b) == pytest.approx(np.sqrt(6.0))
+
+    def test_matches_dtaidistance(self) -> None:
+        dtw_ndim = pytest.importorskip("dtaidistance.dtw_ndim")
+        rng = np.random.default_rng(5)
+        a = rng.random((20, 2))
+        b = rng.random((24, 2))
+
+        expected = dtw_ndim.distance(a, b, use_c=True)
+        assert _simple_dtw(a, b) == pytest.approx(expected, rel=1e-5)
+
+    def test_band_covering_matrix_matches_unconstrained(self) -> None:
+        rng = np.random.default_rng(0)
+        a = rng.random((20, 2))
+        b = rng.random((25, 2))
+
+        assert _simple_dtw(a, b, window=25) == pytest.approx(_simple_dtw(a, b))
+
+    def test_narrow_band_never_beats_unconstrained(self) -> None:
+        rng = np.random.default_rng(1)
+        a = rng.random((30, 2))
+        b = rng.random((30, 2))
+
+        assert _simple_dtw(a, b, window=2) >= _simple_dtw(a, b)
+
+    def test_batch_kernel_matches_single(self) -> None:
+        rng = np.random.default_rng(3)
+        batch = rng.random((4, 16, 2)).astype(np.float32)
+        b = rng.random((16, 2)).astype(np.float32)
+
+        expected = [_simple_dtw(a, b) for a in batch]
+        np.testing.assert_allclose(_dtw_batch_kernel(batch, b, 16), expected, rtol=1e-5)
+
+
+class TestDtwFrechetKernel:
+    def test_matches_separate_computations(self) -> None:
+        rng = np.random.default_rng(4)
+        a = rng.random((18, 2))
+        b = rng.random((23, 2))
+
+        # Reference Fréchet distance from the full coupling matrix
+        dist = np.sqrt(((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=2))
+        coupling = np.empty_like(dist)
+        for i in range(len(a)):
+            for j in range(len(b)):
+                reach = [coupling[i - 1, j]] if i else []
+                reach += [coupling[i, j - 1]] if j else []
+                reach += [coupling[i - 1, j - 1]] if i and j else []
+                coupling[i, j] = max(min(reach), dist[i, j]) if reach else dist[i, j]
+
+        for window, band in ((None, 23), (7, 7)):
+            dtw, frechet = _run_dtw_frechet(a, b, band)
+            assert dtw == pytest.approx(_simple_dtw(a, b, window), rel=1e-5)
+            assert frechet == pytest.approx(coupling[-1, -1], rel=1e-5)
+
+            dtw, frechet = _compute_dtw_frechet(a, b, window)
+            assert dtw == pytest.approx(_compute_dtw(a, b, window), rel=1e-5)
+            assert frechet == pytest.approx(_compute_frechet(a, b))
+        assert _compute_frechet(a, b) == pytest.approx(coupling[-1, -1], rel=1e-5)
+
+
+class TestBatchTotalCurvature:
+    def test_matches_per_stroke_curvature(self) -> None:
+        rng = np.random.default_rng(2)
+        strokes = [rng.random((n, 2)) for n in (5, 2, 8, 3, 1, 12)]
+
+        expected = [_total_curvature(pts) for pts in strokes]
+        np.testing.assert_allclose(batch_total_curvature(strokes), expected)
+
+    def test_empty_input(self) -> None:
+        assert batch_total_curvature([]).shape == (0,)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
-from rm_greg.models import PageData
+from rm_greg.models import PageData, StrokeColor
 
 
 class TestExtractPage:
@@ -25,3 +26,50 @@ class TestExtractPage:
         Skip if not available.
         """
         pytest.skip("Requires .rm fixture file — add real fixture to tests/fixtures/")
+
+
+class TestExtractNotebook:
+    """Tests for extract_notebook function."""
+
+    def test_not_a_directory_raises(self, tmp_path: Path) -> None:
+        from rm_greg.ingest.extractor import extract_notebook
+
+        with pytest.raises(NotADirectoryError):
+            extract_notebook(tmp_path / "missing")
+
+    def test_empty_notebook(self, tmp_path: Path) -> None:
+        from rm_greg.ingest.extractor import extract_notebook
+
+        assert extract_notebook(tmp_path) == []
+
+
+class TestExtractPagesAsync:
+    """Tests for the asyncio extraction helpers."""
+
+    def test_empty_list(self) -> None:
+        from rm_greg.ingest.extractor import extract_pages_async
+
+        assert asyncio.run(extract_pages_async([])) == []
+
+    def test_errors_propagate(self, tmp_path: Path) -> None:
+        from rm_greg.ingest.extractor import extract_pages_async
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(extract_pages_async([tmp_path / "missing.rm"]))
+
+
+class TestMapColor:
+    """Tests for _map_color helper."""
+
+    def test_known_colors(self) -> None:
+        from rm_greg.ingest.extractor import _map_color
+
+        assert _map_color(0) == StrokeColor.BLACK
+        assert _map_color(1) == StrokeColor.GREY
+        assert _map_color(2) == StrokeColor.WHITE
+
+    def test_unknown_color_falls_back_to_black(self) -> None:
+        from rm_greg.ingest.extractor import _map_color
+
+        assert _map_color(9) == StrokeColor.BLACK
+        assert _map_color(-1) == StrokeColor.BLACK
@@ -8,24 +8,26 @@ import numpy as np
 import pytest
 
 from rm_greg.models import NormalizedPoint, NormalizedStroke
-from rm_greg.preprocessing.features import extract_geometric_features
+from rm_greg.preprocessing import features
+from rm_greg.preprocessing.features import (
+    GeometricFeatures,
+    _fast_atan2,
+    _features_kernel,
+    _packed_geometric_features,
+    extract_geometric_features,
+    extract_geometric_features_batch,
+)
 
 
 def _make_line_stroke(
     x_start: float, y_start: float, x_end: float, y_end: float, n_points: int = 10
 ) -> NormalizedStroke:
     """Create a straight-line stroke."""
-    points = []
-    for i in range(n_points):
-        t = i / (n_points - 1)
-        points.append(
-            NormalizedPoint(
-                x=x_start + t * (x_end - x_start),
-                y=y_start + t * (y_end - y_start),
-                pressure=0.5,
-            )
-        )
-    return NormalizedStroke(points=points)
+    xs = np.linspace(x_start, x_end, n_points).tolist()
+    ys = np.linspace(y_start, y_end, n_points).tolist()
+    return NormalizedStroke(
+        points=[NormalizedPoint(x=x, y=y, pressure=0.5) for x, y in zip(xs, ys)]
+    )
 
 
 class TestExtractGeometricFeatures:
@@ -38,25 +40,30 @@ class TestExtractGeometricFeatures:
         stroke = _make_line_stroke(0.1, 0.5, 0.9, 0.5)
         features = extract_geometric_features(stroke)
 
-        assert features.bbox_width == pytest.approx(0.8, abs=0.01)
-        assert features.bbox_height == pytest.approx(0.0, abs=0.01)
-        assert features.straightness == pytest.approx(1.0, abs=0.01)
+        np.testing.assert_allclose(
+            [features.bbox_width, features.bbox_height, features.straightness],
+            [0.8, 0.0, 1.0],
+            atol=0.01,
+        )
         assert features.n_points == 10
 
     def test_vertical_line(self) -> None:
         stroke = _make_line_stroke(0.5, 0.1, 0.5, 0.9)
         features = extract_geometric_features(stroke)
 
-        assert features.bbox_height == pytest.approx(0.8, abs=0.01)
-        assert features.bbox_width == pytest.approx(0.0, abs=0.01)
-        assert features.straightness == pytest.approx(1.0, abs=0.01)
+        np.testing.assert_allclose(
+            [features.bbox_height, features.bbox_width, features.straightness],
+            [0.8, 0.0, 1.0],
+            atol=0.01,
+        )
 
     def test_diagonal_line_has_nonzero_angle(self) -> None:
         stroke = _make_line_stroke(0.1, 0.1, 0.9, 0.9)
         features = extract_geometric_features(stroke)
 
-        assert features.start_angle == pytest.approx(math.pi / 4, abs=0.1)
-        assert features.straightness == pytest.approx(1.0, abs=0.01)
+        np.testing.assert_allclose(
+            [features.start_angle, features.straightness], [math.pi / 4, 1.0], atol=0.01
+        )
 
     def test_feature_array_length(self) -> None:
         stroke = _make_line_stroke(0.1, 0.1, 0.9, 0.9)
@@ -65,3 +72,84 @@ class TestExtractGeometricFeatures:
 
         assert arr.shape == (15,)
         assert arr.dtype == np.float32
+
+    def test_numpy_path_matches_kernel(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        strokes = [
+            _make_line_stroke(0.1, 0.5, 0.9, 0.5, n_points=2),
+            _make_line_stroke(0.5, 0.1, 0.2, 0.9, n_points=25),
+        ]
+        with_kernel = [extract_geometric_features(s).to_array() for s in strokes]
+        monkeypatch.setattr(features, "HAS_NUMBA", False)
+        with_numpy = [extract_geometric_features(s).to_array() for s in strokes]
+
+        np.testing.assert_allclose(with_numpy, with_kernel, rtol=1e-4, atol=1e-5)
+
+    def test_from_array_round_trip(self) -> None:
+        result = extract_geometric_features(_make_line_stroke(0.1, 0.1, 0.9, 0.9))
+        assert GeometricFeatures.from_array(result.to_array()) == result
+
+    def test_results_do_not_depend_on_earlier_calls(self) -> None:
+        short = _make_line_stroke(0.1, 0.1, 0.9, 0.9, n_points=3)
+        first = extract_geometric_features(short).to_array()
+        extract_geometric_features(_make_line_stroke(0.9, 0.1, 0.1, 0.9, n_points=500))
+
+        np.testing.assert_array_equal(extract_geometric_features(short).to_array(), first)
+
+
+class TestExtractGeometricFeaturesBatch:
+    def test_matches_single_stroke_extraction(self) -> None:
+        strokes = [
+            _make_line_stroke(0.1, 0.5, 0.9, 0.5),
+            _make_line_stroke(0.1, 0.1, 0.9, 0.9, n_points=2),
+            _make_line_stroke(0.5, 0.1, 0.5, 0.9, n_points=25),
+        ]
+        expected = np.stack([extract_geometric_features(s).to_array() for s in strokes])
+
+        result = extract_geometric_features_batch(strokes)
+        assert result.shape == (3, 15)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+    def test_rejects_single_point(self) -> None:
+        strokes = [
+            _make_line_stroke(0.1, 0.5, 0.9, 0.5),
+            NormalizedStroke(points=[NormalizedPoint(x=0.5, y=0.5)]),
+        ]
+        with pytest.raises(ValueError, match="at least 2 points"):
+            extract_geometric_features_batch(strokes)
+
+    def test_empty_batch(self) -> None:
+        assert extract_geometric_features_batch([]).shape == (0, 15)
+
+    def test_sees_points_appended_after_caching(self) -> None:
+        stroke = _make_line_stroke(0.1, 0.5, 0.5, 0.5)
+        extract_geometric_features_batch([stroke])
+        stroke.points.append(NormalizedPoint(x=0.9, y=0.5, pressure=0.5))
+
+        expected = extract_geometric_features(NormalizedStroke(points=list(stroke.points)))
+        result = extract_geometric_features_batch([stroke, stroke])
+        np.testing.assert_allclose(result[1], expected.to_array(), rtol=1e-5, atol=1e-6)
+
+    def test_kernel_matches_numpy_path(self) -> None:
+        rng = np.random.default_rng(0)
+        lengths = [2, 3, 17, 40]
+        arr = rng.uniform(0.0, 1.0, (sum(lengths), 6)).astype(np.float32)
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+        out = np.empty((len(lengths), 15), dtype=np.float32)
+        _features_kernel(arr, offsets, out)
+        np.testing.assert_allclose(
+            out, _packed_geometric_features(arr, offsets), rtol=1e-4, atol=1e-5
+        )
+
+
+class TestFastAtan2:
+    def test_matches_arctan2(self) -> None:
+        rng = np.random.default_rng(0)
+        ys, xs = rng.standard_normal((2, 1000))
+        result = np.array([_fast_atan2(y, x) for y, x in zip(ys, xs)])
+        np.testing.assert_allclose(result, np.arctan2(ys, xs), atol=1e-5)
+
+    def test_axes_and_origin(self) -> None:
+        for y, x in [(0.0, 1.0), (1.0, 0.0), (0.0, -1.0), (-1.0, 0.0), (-0.0, -1.0), (0.0, 0.0)]:
+            assert _fast_atan2(y, x) == pytest.approx(math.atan2(y, x), abs=1e-5)
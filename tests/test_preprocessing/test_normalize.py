@@ -7,9 +7,11 @@ import pytest
 
 from rm_greg.models import NormalizedPoint, NormalizedStroke, PageData, Point, Stroke
 from rm_greg.preprocessing.normalize import (
+    NORMALIZED_COLUMNS,
     RM_HEIGHT,
     RM_WIDTH,
     interpolate_stroke,
+    normalize_page_array,
     normalize_point_coords,
     normalize_stroke,
     normalize_strokes,
@@ -87,6 +89,47 @@ class TestStrokeToArray:
         assert arr[0, 1] == pytest.approx(0.2)
         assert arr[0, 2] == pytest.approx(0.5)
 
+    def test_cached_and_read_only(self) -> None:
+        stroke = NormalizedStroke(points=[NormalizedPoint(x=0.1, y=0.2)])
+        assert stroke.array is stroke.array
+        assert not stroke.array.flags.writeable
+
+    def test_returns_writable_copy(self) -> None:
+        stroke = NormalizedStroke(points=[NormalizedPoint(x=0.1, y=0.2)])
+        arr = stroke_to_array(stroke)
+        arr[0, 0] = 0.9
+        assert stroke.array[0, 0] == pytest.approx(0.1)
+
+    def test_cache_follows_appended_points(self) -> None:
+        stroke = NormalizedStroke(points=[NormalizedPoint(x=0.1, y=0.2)])
+        _ = stroke.array
+        stroke.points.append(NormalizedPoint(x=0.3, y=0.4))
+        assert stroke.array.shape == (2, 6)
+        assert stroke.array[1, 0] == pytest.approx(0.3)
+
+    def test_cache_follows_replaced_points(self) -> None:
+        stroke = NormalizedStroke.from_array(np.array([[0.1, 0.2, 0.0, 0.0, 0.0, 0.0]]))
+        copy = stroke.model_copy(update={"points": [NormalizedPoint(x=0.7, y=0.8)]})
+        assert copy.array[0, 0] == pytest.approx(0.7)
+        stroke.points = [NormalizedPoint(x=0.5, y=0.5)]
+        assert stroke.array[0, 0] == pytest.approx(0.5)
+
+    def test_cache_does_not_affect_equality(self) -> None:
+        points = [NormalizedPoint(x=0.1, y=0.2), NormalizedPoint(x=0.3, y=0.4)]
+        a = NormalizedStroke(points=points)
+        b = NormalizedStroke(points=points)
+        stroke_to_array(a)
+        assert a == b
+        stroke_to_array(b)
+        assert a == b
+
+    def test_from_array_round_trip(self) -> None:
+        arr = np.array([[0.1, 0.2, 0.5, 0.0, 0.3, 0.0], [0.4, 0.6, 0.7, 0.0, 0.2, 0.0]])
+        stroke = NormalizedStroke.from_array(arr, timestamps=np.array([0.0, 1.0]))
+        assert stroke.points[1].timestamp == 1.0
+        assert stroke == NormalizedStroke(points=stroke.points)
+        np.testing.assert_array_equal(stroke.array, arr.astype(np.float32))
+
 
 class TestInterpolateStroke:
     def test_output_length(self) -> None:
@@ -107,3 +150,37 @@ class TestInterpolateStroke:
         result = interpolate_stroke(arr, target_length=10)
         assert result[0, 0] == pytest.approx(0.0)
         assert result[-1, 0] == pytest.approx(1.0)
+
+
+class TestNormalizePageArray:
+    def test_packs_strokes_with_offsets(self) -> None:
+        page = PageData(
+            page_id="p",
+            strokes=[
+                Stroke(points=[Point(x=0.0, y=0.0), Point(x=RM_WIDTH, y=RM_HEIGHT)]),
+                Stroke(points=[Point(x=RM_WIDTH * 2, y=-10.0, pressure=0.3)]),
+            ],
+        )
+        arr, offsets = normalize_page_array(page)
+
+        assert arr.shape == (3, len(NORMALIZED_COLUMNS))
+        np.testing.assert_array_equal(offsets, [0, 2, 3])
+        np.testing.assert_allclose(arr[:, :2], [[0.0, 0.0], [1.0, 1.0], [1.0, 0.0]])
+        assert arr[2, 2] == pytest.approx(0.3)
+
+    def test_matches_per_stroke_normalization(self) -> None:
+        page = PageData(
+            page_id="p",
+            strokes=[
+                Stroke(points=[Point(x=100.0, y=200.0, pressure=0.5)]),
+                Stroke(points=[Point(x=700.0, y=900.0), Point(x=710.0, y=905.0)]),
+            ],
+        )
+        assert normalize_strokes(page) == [normalize_stroke(s) for s in page.strokes]
+
+    def test_batch_matches_single(self) -> None:
+        batch = np.random.rand(3, 10, 6).astype(np.float32)
+        result = interpolate_stroke(batch, target_length=32)
+        assert result.shape == (3, 32, 6)
+        for stroke, resampled in zip(batch, result):
+            np.testing.assert_allclose(resampled, interpolate_stroke(stroke, 32))
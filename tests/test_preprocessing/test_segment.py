@@ -39,6 +39,23 @@ class TestSegmentGlyphs:
         result = segment_glyphs([s1, s2], gap_threshold=0.05)
         assert len(result) == 2
 
+    def test_splits_at_each_gap(self) -> None:
+        strokes = [
+            _make_stroke(0.1, 0.1, 0.12, 0.12),
+            _make_stroke(0.13, 0.13, 0.15, 0.15),
+            NormalizedStroke(points=[]),
+            _make_stroke(0.5, 0.5, 0.52, 0.52),
+            _make_stroke(0.9, 0.9, 0.92, 0.92),
+        ]
+        result = segment_glyphs(strokes, gap_threshold=0.05)
+        assert result == [strokes[:2], [strokes[3]], [strokes[4]]]
+
+    def test_empty_first_stroke_is_own_group(self) -> None:
+        empty = NormalizedStroke(points=[])
+        s1 = _make_stroke(0.1, 0.1, 0.12, 0.12)
+        s2 = _make_stroke(0.13, 0.13, 0.15, 0.15)
+        assert segment_glyphs([empty, s1, s2]) == [[empty], [s1, s2]]
+
 
 class TestSegmentByGrid:
     def test_empty_input(self) -> None:
@@ -51,3 +68,18 @@ class TestSegmentByGrid:
         result = segment_by_grid([stroke], rows=2, cols=2)
         assert (0, 0) in result
         assert len(result[(0, 0)]) == 1
+
+    def test_groups_by_centroid(self) -> None:
+        strokes = [
+            _make_stroke(0.1, 0.1, 0.2, 0.2),
+            _make_stroke(0.6, 0.1, 0.9, 0.2),
+            NormalizedStroke(points=[]),
+            _make_stroke(0.2, 0.1, 0.3, 0.3),
+            _make_stroke(0.6, 0.6, 1.0, 1.0),
+        ]
+        result = segment_by_grid(strokes, rows=2, cols=2)
+        assert result == {
+            (0, 0): [strokes[0], strokes[3]],
+            (0, 1): [strokes[1]],
+            (1, 1): [strokes[4]],
+        }
@@ -58,3 +58,14 @@ class TestSyntheticGenerator:
         )
         for stroke in dataset.strokes:
             assert len(stroke.points) >= 10
+
+    def test_output_independent_of_workers(self) -> None:
+        primitives = [GreggPrimitive.A, GreggPrimitive.T, GreggPrimitive.S]
+        sequential = SyntheticGenerator(seed=7).generate_dataset(
+            primitives=primitives, samples_per_class=4, max_workers=1
+        )
+        parallel = SyntheticGenerator(seed=7).generate_dataset(
+            primitives=primitives, samples_per_class=4, max_workers=2
+        )
+        assert parallel.labels == sequential.labels
+        assert parallel.strokes == sequential.strokes
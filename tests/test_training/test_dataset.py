@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from rm_greg.models import NormalizedPoint, NormalizedStroke
+from rm_greg.preprocessing.features import extract_geometric_features_batch
 from rm_greg.training.dataset import StrokeDataset
 
 
@@ -38,6 +43,32 @@ class TestStrokeDataset:
         assert X.shape[1] == 15  # Number of geometric features
         assert y.shape == (10,)
 
+    def test_feature_matrix_tracks_added_samples(self) -> None:
+        ds = StrokeDataset()
+        ds.add_sample(_make_sample_stroke(), "a")
+        ds.add_sample(NormalizedStroke(points=[NormalizedPoint(x=0.5, y=0.5)]), "dot")
+        first, _ = ds.get_feature_matrix()
+        for _ in range(3):
+            ds.add_sample(_make_sample_stroke(), "t")
+
+        X, y = ds.get_feature_matrix()
+        assert y.tolist() == ["a", "t", "t", "t"]
+        np.testing.assert_array_equal(X[0], first[0])
+        np.testing.assert_array_equal(
+            X, extract_geometric_features_batch([s for s in ds.strokes if len(s.points) >= 2])
+        )
+        assert not X.flags.writeable
+
+    def test_feature_matrix_follows_replaced_strokes(self) -> None:
+        ds = StrokeDataset()
+        ds.add_sample(_make_sample_stroke(), "a")
+        ds.get_feature_matrix()
+        ds.strokes, ds.labels = [], []
+
+        X, y = ds.get_feature_matrix()
+        assert X.shape == (0, 15)
+        assert y.shape == (0,)
+
     def test_get_sequence_arrays_shape(self) -> None:
         ds = StrokeDataset()
         for _ in range(3):
@@ -58,3 +89,47 @@ class TestStrokeDataset:
         loaded = StrokeDataset.load(save_path)
         assert len(loaded) == 2
         assert loaded.labels == ["a", "t"]
+
+    def test_json_matches_stdlib_encoding(self, tmp_path: Path) -> None:
+        ds = StrokeDataset()
+        ds.add_sample(_make_sample_stroke(), "a")
+
+        save_path = tmp_path / "test_dataset.json"
+        ds.save(save_path)
+
+        expected = {
+            "samples": [
+                {"label": "a", "points": [p.model_dump() for p in ds.strokes[0].points]}
+            ]
+        }
+        assert save_path.read_text() == json.dumps(expected, indent=2)
+
+    def test_save_and_load_npz(self, tmp_path: Path) -> None:
+        ds = StrokeDataset()
+        ds.add_sample(_make_sample_stroke(), "a")
+        ds.add_sample(NormalizedStroke(points=[]), "empty")
+        ds.add_sample(_make_sample_stroke(), "t")
+
+        save_path = tmp_path / "test_dataset.npz"
+        ds.save(save_path)
+
+        loaded = StrokeDataset.load(save_path)
+        assert loaded.labels == ["a", "empty", "t"]
+        assert [s.points for s in loaded.strokes] == [s.points for s in ds.strokes]
+        assert loaded.strokes[0].label == "a"
+
+    def test_get_sequence_arrays_mixed_lengths_keep_order(self) -> None:
+        ds = StrokeDataset()
+        short = _make_sample_stroke()
+        long = NormalizedStroke(
+            points=[NormalizedPoint(x=0.1 * i, y=0.05 * i) for i in range(6)]
+        )
+        ds.add_sample(long, "l")
+        ds.add_sample(short, "a")
+        ds.add_sample(NormalizedStroke(points=[NormalizedPoint(x=0.5, y=0.5)]), "skip")
+        ds.add_sample(long, "l")
+
+        X, y = ds.get_sequence_arrays(target_length=16)
+        assert y.tolist() == ["l", "a", "l"]
+        assert X[1, -1, 0] == pytest.approx(0.3)
+        assert X[2, -1, 0] == pytest.approx(0.5)
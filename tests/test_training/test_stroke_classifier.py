@@ -0,0 +1,59 @@
+"""Tests for the StrokeClassifier class."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from rm_greg.models import GreggPrimitive
+from rm_greg.synthetic.generator import SyntheticGenerator
+from rm_greg.training.dataset import StrokeDataset
+from rm_greg.training.stroke_classifier import StrokeClassifier
+
+pytest.importorskip("sklearn")
+
+
+@pytest.fixture(scope="module")
+def dataset() -> StrokeDataset:
+    return SyntheticGenerator(seed=0).generate_dataset(
+        primitives=[GreggPrimitive.A, GreggPrimitive.T, GreggPrimitive.R],
+        samples_per_class=10,
+    )
+
+
+@pytest.fixture(scope="module")
+def classifier(dataset: StrokeDataset) -> StrokeClassifier:
+    classifier = StrokeClassifier("rf")
+    classifier.train(dataset)
+    return classifier
+
+
+class TestStrokeClassifier:
+    def test_predict_batch_matches_single(
+        self, classifier: StrokeClassifier, dataset: StrokeDataset
+    ) -> None:
+        strokes = dataset.strokes[::4]
+        assert classifier.predict_batch(strokes) == [classifier.predict(s) for s in strokes]
+
+    def test_predict_proba_batch_matches_single(
+        self, classifier: StrokeClassifier, dataset: StrokeDataset
+    ) -> None:
+        strokes = dataset.strokes[::4]
+        batch = classifier.predict_proba_batch(strokes)
+        assert batch == [classifier.predict_proba(s) for s in strokes]
+        assert set(batch[0]) == {"a", "t", "r"}
+        assert sum(batch[0].values()) == pytest.approx(1.0)
+
+    def test_empty_batch(self, classifier: StrokeClassifier) -> None:
+        assert classifier.predict_batch([]) == []
+        assert classifier.predict_proba_batch([]) == []
+
+    def test_save_and_load(
+        self, classifier: StrokeClassifier, dataset: StrokeDataset, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "model.pkl"
+        classifier.save(path)
+        loaded = StrokeClassifier.load(path)
+        strokes = dataset.strokes[:5]
+        assert loaded.predict_proba_batch(strokes) == classifier.predict_proba_batch(strokes)